@@ -5,4 +5,6 @@ so that `from src.xxx import ...` works in all test files.
 import sys
 import os
 
-sys.path.insert(0, os.path.dirname(__file__))
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
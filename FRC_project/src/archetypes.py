@@ -0,0 +1,361 @@
+"""
+FRC 2026 REBUILT Match Simulation -- Robot Archetype Defaults
+
+Per-archetype default parameters derived from Sections 7.5 and 7.6 of the
+game specification (FRC simulation.md), plus the integer-id resolver.
+
+``src.config`` re-exports the public names here on first access.
+"""
+
+import sys
+from dataclasses import dataclass, field
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple, Union
+
+
+# =============================================================================
+# Archetype Default Configurations
+# =============================================================================
+# Derived from Section 7.6 Archetype Summary Table, Section 7.5 Community Robot
+# Baselines, and Section 7.9 Climb Success Rates.
+#
+# cycle_time_mean / cycle_time_stddev follow the spec rule: stddev = 15% of mean.
+# Accuracy is the midpoint of the range from the archetype summary table.
+# auto_fuel is the midpoint of the range.
+# fuel_capacity is the midpoint of the range (rounded).
+# climb_level is the highest level the archetype targets.
+#
+# Each archetype is a frozen, slotted ArchetypeSpec built once at import and
+# shared by every robot; the outer mapping is read-only.
+# =============================================================================
+
+
+# Categorical ArchetypeSpec fields that are interned on construction.
+_SPEC_STRING_FIELDS: Tuple[str, ...] = (
+    "shooter_type",
+    "shooter_angle",
+    "hopper_type",
+    "indexer_type",
+    "intake_type",
+    "intake_quality",
+    "intake_robustness",
+    "drivetrain",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ArchetypeSpec:
+    """Immutable default parameters for one robot archetype.
+
+    A slotted dataclass rather than a NamedTuple: on CPython 3.11+ slot
+    reads specialise to a direct load, which beats NamedTuple's descriptor
+    getter, and instances carry no tuple length header.
+    """
+
+    fuel_capacity: int
+    storage_capacity: int
+    cycle_time_mean: float
+    cycle_time_stddev: float
+    auto_fuel: int
+    auto_cycles: int
+    climb_level: int
+    accuracy: float
+    climb_success_L1: float
+    climb_success_L2: float
+    climb_success_L3: float
+    shooter_type: str
+    shooter_angle: str
+    hopper_type: str
+    indexer_type: str
+    intake_rate: float
+    shoot_rate: float
+    effective_range: float
+    can_shoot_while_moving: bool
+    intake_type: str
+    intake_quality: str
+    intake_robustness: str
+    drivetrain: str
+    free_speed_fps: float
+    auto_climb: bool
+    climb_start_time: float
+
+    # Derived in __post_init__: success probability indexed by climb level
+    # (index 0 = no climb), so callers avoid building "climb_success_L{n}".
+    climb_success: Tuple[float, float, float, float] = field(
+        init=False, repr=False, compare=False
+    )
+    # Derived in __post_init__: cumulative outcome thresholds per target
+    # level.  For a uniform u, bisect_right(climb_cdf[target], u) gives 0 for
+    # a clean climb, 1 for the one-level-lower fallback, len() for a miss.
+    climb_cdf: Tuple[Tuple[float, ...], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Intern categorical strings so specs built from external overrides
+        # share storage with source literals and compare by identity.
+        for name in _SPEC_STRING_FIELDS:
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+        object.__setattr__(
+            self,
+            "climb_success",
+            (0.0, self.climb_success_L1, self.climb_success_L2, self.climb_success_L3),
+        )
+        p = self.climb_success
+        object.__setattr__(
+            self,
+            "climb_cdf",
+            (
+                (),
+                (p[1],),
+                (p[2], p[2] + (1.0 - p[2]) * p[1]),
+                (p[3], p[3] + (1.0 - p[3]) * p[2]),
+            ),
+        )
+
+
+
+ARCHETYPE_DEFAULTS: Mapping[str, ArchetypeSpec] = MappingProxyType({
+    "elite_turret": ArchetypeSpec(
+        # Section 7.5: Custom Elite / Section 7.6 row 1
+        fuel_capacity=14,                    # realistic storage
+        storage_capacity=14,
+        cycle_time_mean=8.5,                 # 7-10s
+        cycle_time_stddev=1.275,             # 15% of 8.5
+        auto_fuel=8,                         # full preload (1 cycle)
+        auto_cycles=1,
+        climb_level=3,                       # L3
+        accuracy=0.90,                       # 85-95%, midpoint
+        climb_success_L1=0.99,
+        climb_success_L2=0.95,
+        climb_success_L3=0.85,
+        shooter_type="single_turret",
+        shooter_angle="full_variable",
+        hopper_type="spindexer",
+        indexer_type="spindexer",
+        intake_rate=8.0,                     # fuel/s
+        shoot_rate=10.0,                     # fuel/s
+        effective_range=20.0,                # 4-20+ ft
+        can_shoot_while_moving=True,
+        intake_type="over_bumper",
+        intake_quality="touch_and_go",
+        intake_robustness="medium",          # under-bumper is more exposed
+        drivetrain="swerve",
+        free_speed_fps=16.0,                 # L2/L3 tier swerve
+        auto_climb=False,
+        climb_start_time=12.0,               # L3 target: start climb with 12s left
+    ),
+    "elite_multishot": ArchetypeSpec(
+        # Section 7.5: WCP CC "Big Dumper" / Section 7.6 row 2
+        fuel_capacity=20,                    # realistic storage
+        storage_capacity=20,
+        cycle_time_mean=12.0,                # 10-14s
+        cycle_time_stddev=1.8,               # 15% of 12.0
+        auto_fuel=8,                         # full preload (1 cycle)
+        auto_cycles=1,
+        climb_level=3,                       # L2-L3, targets L3
+        accuracy=0.775,                      # 70-85%, midpoint
+        climb_success_L1=0.99,
+        climb_success_L2=0.90,
+        climb_success_L3=0.75,
+        shooter_type="triple_fixed",
+        shooter_angle="fixed_high",
+        hopper_type="serializer",
+        indexer_type="serializer",
+        intake_rate=8.0,                     # fuel/s
+        shoot_rate=15.0,                     # fuel/s
+        effective_range=12.0,                # 4-12 ft
+        can_shoot_while_moving=False,
+        intake_type="over_bumper",
+        intake_quality="touch_and_go",
+        intake_robustness="high",
+        drivetrain="swerve",
+        free_speed_fps=15.0,                 # L2 swerve
+        auto_climb=False,
+        climb_start_time=12.0,               # L3 target
+    ),
+    "strong_scorer": ArchetypeSpec(
+        # Section 7.6 row 3: Upgraded Everybot
+        fuel_capacity=14,                    # realistic storage
+        storage_capacity=14,
+        cycle_time_mean=14.0,                # 12-16s
+        cycle_time_stddev=2.1,               # 15% of 14.0
+        auto_fuel=6,                         # 6 preloaded
+        auto_cycles=1,
+        climb_level=2,                       # L2
+        accuracy=0.725,                      # 65-80%, midpoint
+        climb_success_L1=0.98,
+        climb_success_L2=0.85,
+        climb_success_L3=0.55,
+        shooter_type="double_fixed",
+        shooter_angle="adjustable",
+        hopper_type="medium",
+        indexer_type="conveyor",
+        intake_rate=6.0,                     # fuel/s
+        shoot_rate=8.0,                      # fuel/s
+        effective_range=10.0,                # 4-10 ft
+        can_shoot_while_moving=False,
+        intake_type="over_bumper",
+        intake_quality="touch_and_go",
+        intake_robustness="high",
+        drivetrain="swerve",
+        free_speed_fps=14.0,                 # L2 swerve
+        auto_climb=False,
+        climb_start_time=8.0,                # L2 target
+    ),
+    "everybot": ArchetypeSpec(
+        # Section 7.5: Robonauts 118 Everybot / Section 7.6 row 4
+        fuel_capacity=10,                    # realistic storage
+        storage_capacity=10,
+        cycle_time_mean=18.5,                # 15-22s
+        cycle_time_stddev=2.775,             # 15% of 18.5
+        auto_fuel=4,                         # 4 preloaded
+        auto_cycles=1,
+        climb_level=2,                       # L1-L2, targets L2
+        accuracy=0.575,                      # 50-65%, midpoint
+        climb_success_L1=0.95,
+        climb_success_L2=0.70,
+        climb_success_L3=0.25,
+        shooter_type="single_fixed",
+        shooter_angle="fixed_high",
+        hopper_type="medium",
+        indexer_type="conveyor",
+        intake_rate=4.0,                     # fuel/s
+        shoot_rate=6.0,                      # fuel/s
+        effective_range=8.0,                 # 3-8 ft
+        can_shoot_while_moving=False,
+        intake_type="over_bumper",
+        intake_quality="slow_pickup",
+        intake_robustness="high",
+        drivetrain="swerve",
+        free_speed_fps=13.0,                 # L2 swerve (or tank)
+        auto_climb=False,
+        climb_start_time=8.0,                # L2 target
+    ),
+    "kitbot_plus": ArchetypeSpec(
+        # Section 7.5: Iterated KitBot / Section 7.6 row 5
+        fuel_capacity=20,                    # realistic storage
+        storage_capacity=20,
+        cycle_time_mean=24.0,                # 20-28s
+        cycle_time_stddev=3.6,               # 15% of 24.0
+        auto_fuel=3,                         # 3 preloaded
+        auto_cycles=1,
+        climb_level=1,                       # L1
+        accuracy=0.475,                      # 40-55%, midpoint
+        climb_success_L1=0.80,
+        climb_success_L2=0.30,
+        climb_success_L3=0.0,
+        shooter_type="single_fixed",
+        shooter_angle="fixed_low",
+        hopper_type="large",
+        indexer_type="gravity_fed",
+        intake_rate=3.0,                     # fuel/s
+        shoot_rate=4.0,                      # fuel/s
+        effective_range=6.0,                 # 2-6 ft
+        can_shoot_while_moving=False,
+        intake_type="over_bumper",
+        intake_quality="slow_pickup",
+        intake_robustness="high",
+        drivetrain="tank",
+        free_speed_fps=12.0,                 # AM14U tank
+        auto_climb=False,
+        climb_start_time=5.0,                # L1 target
+    ),
+    "kitbot_base": ArchetypeSpec(
+        # Section 7.5: Stock KitBot / Section 7.6 row 6
+        fuel_capacity=15,                    # realistic storage
+        storage_capacity=15,
+        cycle_time_mean=30.0,                # 25-35s
+        cycle_time_stddev=4.5,               # 15% of 30.0
+        auto_fuel=1,                         # 1 preloaded
+        auto_cycles=1,
+        climb_level=0,                       # None
+        accuracy=0.375,                      # 30-45%, midpoint
+        climb_success_L1=0.0,
+        climb_success_L2=0.0,
+        climb_success_L3=0.0,
+        shooter_type="single_fixed",
+        shooter_angle="fixed_low",
+        hopper_type="large",
+        indexer_type="gravity_fed",
+        intake_rate=2.0,                     # fuel/s
+        shoot_rate=3.0,                      # fuel/s
+        effective_range=4.0,                 # 2-6 ft (shorter end)
+        can_shoot_while_moving=False,
+        intake_type="funnel",
+        intake_quality="push_around",
+        intake_robustness="medium",
+        drivetrain="tank",
+        free_speed_fps=10.0,                 # AM14U tank, slow
+        auto_climb=False,
+        climb_start_time=0.0,                # no climb
+    ),
+    "defense_bot": ArchetypeSpec(
+        # Section 7.6 row 7
+        fuel_capacity=2,                     # 0-3, midpoint ~2
+        storage_capacity=2,
+        cycle_time_mean=0.0,                 # N/A -- does not score cycles
+        cycle_time_stddev=0.0,
+        auto_fuel=0,                         # 0-1, low end
+        auto_cycles=0,
+        climb_level=1,                       # L1
+        accuracy=0.275,                      # 20-35%, midpoint
+        climb_success_L1=0.75,
+        climb_success_L2=0.10,
+        climb_success_L3=0.0,
+        shooter_type="none",
+        shooter_angle="none",
+        hopper_type="small",
+        indexer_type="none",
+        intake_rate=0.0,                     # no intake
+        shoot_rate=0.0,                      # no shooter
+        effective_range=0.0,
+        can_shoot_while_moving=False,
+        intake_type="none",
+        intake_quality="no_ground_pickup",
+        intake_robustness="high",            # minimal mechanisms to fail
+        drivetrain="swerve",
+        free_speed_fps=14.0,                 # fast for chasing opponents
+        auto_climb=True,                     # defense bots may attempt L1 in auto
+        climb_start_time=5.0,                # L1 target
+    ),
+})
+
+
+# =============================================================================
+# Archetype resolver
+# =============================================================================
+# The archetype set is fixed, so specs are also addressable by a dense integer
+# id.  Hot callers hold an ArchetypeName and index the tuple directly; string
+# callers pay a single interned-key lookup.
+
+class ArchetypeName(IntEnum):
+    """Dense integer id for each ARCHETYPE_DEFAULTS entry (insertion order)."""
+
+    ELITE_TURRET = 0
+    ELITE_MULTISHOT = 1
+    STRONG_SCORER = 2
+    EVERYBOT = 3
+    KITBOT_PLUS = 4
+    KITBOT_BASE = 5
+    DEFENSE_BOT = 6
+
+
+_ARCHETYPES_BY_ID: Tuple[ArchetypeSpec, ...] = tuple(ARCHETYPE_DEFAULTS.values())
+_NAME_TO_ID: Dict[str, ArchetypeName] = {
+    sys.intern(key): ArchetypeName[key.upper()] for key in ARCHETYPE_DEFAULTS
+}
+
+
+def get_archetype(name: Union[str, ArchetypeName]) -> ArchetypeSpec:
+    """Return the shared ArchetypeSpec for an archetype key or id.
+
+    Raises
+    ------
+    KeyError
+        If *name* is a string that is not a key in ARCHETYPE_DEFAULTS.
+    """
+    if isinstance(name, ArchetypeName):
+        return _ARCHETYPES_BY_ID[name]
+    return _ARCHETYPES_BY_ID[_NAME_TO_ID[name]]
@@ -16,8 +16,7 @@ at the end of each tick to verify correctness during development.
 
 from __future__ import annotations
 
-import math
-from typing import List, Tuple
+from typing import List
 
 from src.models import (
     Alliance,
@@ -29,20 +28,52 @@ from src.config import (
     INITIAL_NEUTRAL_FUEL,
     INITIAL_OUTPOST_FUEL,
     TOTAL_FUEL,
-    FUEL_HUB_TRANSIT_TIME,
-    FUEL_MISS_RECOVERY_TIME,
+    FUEL_HUB_TRANSIT_TICKS,
+    FUEL_MISS_RECOVERY_TICKS,
     HP_THROW_FLIGHT_TIME,
     MAX_TOWER_OCCUPANTS,
-    PUSH_SCATTER_RATE,
+    PUSH_SCATTER_DEN,
+    PUSH_SCATTER_NUM,
+    TICK_INTERVAL,
 )
 
 
+class _AllianceIndex(dict):
+    """Alliance -> index lookup that rejects unknown alliances by name."""
+
+    __slots__ = ()
+
+    def __missing__(self, alliance):
+        raise ValueError(f"Unknown alliance {alliance!r}; expected 'red' or 'blue'.")
+
+
+# Index into FieldState's [red, blue] lists; accepts strings and Alliance members.
+# A dict subclass so the hit path stays a plain subscript.
+_ALLIANCE_IDX = _AllianceIndex({"red": 0, "blue": 1, Alliance.RED: 0, Alliance.BLUE: 1})
+
+# Ring slots needed so that no scheduled return wraps onto a pending one.
+_TRANSIT_RING_SIZE = max(FUEL_HUB_TRANSIT_TICKS, FUEL_MISS_RECOVERY_TICKS) + 2
+
+# Enum members read per robot per tick, bound once (Enum class attribute
+# access is slow; see the matching note in robot.py).
+_HUB, _RED = RobotZone.HUB, Alliance.RED
+
+# Hub congestion by number of same-alliance robots at the hub (0-6):
+# min(1.0, max(0, n - 1) / 2), so a lone robot has no penalty.
+_CONGESTION_BY_COUNT = tuple(min(1.0, max(0, n - 1) / 2.0) for n in range(7))
+
+
+def _to_tick(current_time: float) -> int:
+    """Convert elapsed match time to its integer tick index."""
+    return int(current_time / TICK_INTERVAL + 0.5)
+
+
 class FieldManager:
     """Manages the global field state for one match.
 
     The field tracks every fuel ball across five disjoint pools:
         neutral_fuel_available  -- pickable fuel in the neutral zone
-        red/blue_outpost_fuel   -- fuel at each alliance's outpost stations
+        outpost_fuel[red/blue]  -- fuel at each alliance's outpost stations
         fuel_in_flight          -- airborne fuel (shot but not yet in Hub)
         fuel_in_transit         -- fuel falling through Hub back to neutral zone
 
@@ -53,9 +84,11 @@ class FieldManager:
         neutral + red_outpost + blue_outpost + in_flight + in_transit
         + sum(robot.fuel_held + robot.fuel_being_pushed) == TOTAL_FUEL
 
-    The transit_queue is a time-ordered list of ``(return_time, count)`` tuples.
-    Each entry represents fuel that will become available in the neutral zone
-    once ``current_time >= return_time``.
+    Fuel in transit is scheduled on integer tick indices.  ``transit_buckets``
+    is a fixed-size ring (a calendar queue): slot ``tick % len`` holds the
+    number of balls that return to the neutral zone on that tick.  Every
+    transit delay is shorter than the ring, so insertion and draining are
+    both O(1) per tick.
     """
 
     # ------------------------------------------------------------------
@@ -73,13 +106,11 @@ class FieldManager:
         """
         self._state = FieldState(
             neutral_fuel_available=INITIAL_NEUTRAL_FUEL,
-            red_outpost_fuel=INITIAL_OUTPOST_FUEL,
-            blue_outpost_fuel=INITIAL_OUTPOST_FUEL,
+            outpost_fuel=[INITIAL_OUTPOST_FUEL, INITIAL_OUTPOST_FUEL],
             fuel_in_flight=0,
             fuel_in_transit=0,
-            transit_queue=[],
-            red_tower_occupants=[],
-            blue_tower_occupants=[],
+            transit_buckets=[0] * _TRANSIT_RING_SIZE,
+            tower_occupants=[[], []],
             congestion_red_hub=0.0,
             congestion_blue_hub=0.0,
         )
@@ -128,15 +159,25 @@ class FieldManager:
 
     def _process_transit_queue(self, current_time: float) -> None:
         """Move fuel from transit back to the neutral zone when its timer expires."""
-        still_pending: List[Tuple[float, int]] = []
-        for return_time, count in self._state.transit_queue:
-            if return_time <= current_time:
-                # Fuel has arrived back on the field.
-                self._state.neutral_fuel_available += count
-                self._state.fuel_in_transit -= count
-            else:
-                still_pending.append((return_time, count))
-        self._state.transit_queue = still_pending
+        state = self._state
+        target = _to_tick(current_time)
+        if not state.fuel_in_transit:
+            # fuel_in_transit is the ring's total, so every slot is empty.
+            if target > state.transit_tick:
+                state.transit_tick = target
+            return
+        ring = state.transit_buckets
+        returned = 0
+        # Normally one slot per call; catches up if ticks were skipped.
+        for tick in range(state.transit_tick + 1, target + 1):
+            slot = tick % _TRANSIT_RING_SIZE
+            returned += ring[slot]
+            ring[slot] = 0
+        if returned:
+            state.neutral_fuel_available += returned
+            state.fuel_in_transit -= returned
+        if target > state.transit_tick:
+            state.transit_tick = target
 
     def _update_congestion(self, robots: List[RobotState]) -> None:
         """Compute hub congestion as a fraction of max possible crowding.
@@ -155,16 +196,17 @@ class FieldManager:
         red_at_hub = 0
         blue_at_hub = 0
         for r in robots:
-            if r.position == RobotZone.HUB:
-                if r.alliance == Alliance.RED:
+            if r.position is _HUB:
+                if r.alliance is _RED:
                     red_at_hub += 1
                 else:
                     blue_at_hub += 1
 
         # Congestion is 0 when 0-1 robots are at the hub, scales linearly up to 1.0
-        # with 3 robots present.  We use max(0, n-1)/2 so a lone robot has no penalty.
-        self._state.congestion_red_hub = min(1.0, max(0, red_at_hub - 1) / 2.0)
-        self._state.congestion_blue_hub = min(1.0, max(0, blue_at_hub - 1) / 2.0)
+        # with 3 robots present (see _CONGESTION_BY_COUNT).
+        state = self._state
+        state.congestion_red_hub = _CONGESTION_BY_COUNT[red_at_hub]
+        state.congestion_blue_hub = _CONGESTION_BY_COUNT[blue_at_hub]
 
     # ------------------------------------------------------------------
     # Fuel Scoring Events
@@ -209,9 +251,7 @@ class FieldManager:
         if count <= 0:
             return
         self._state.fuel_in_flight -= count
-        self._state.fuel_in_transit += count
-        return_time = current_time + FUEL_HUB_TRANSIT_TIME
-        self._state.transit_queue.append((return_time, count))
+        self._schedule_return(count, current_time, FUEL_HUB_TRANSIT_TICKS)
 
     def fuel_missed(self, count: int, current_time: float) -> None:
         """Record that *count* airborne fuel balls missed the Hub.
@@ -230,9 +270,19 @@ class FieldManager:
         if count <= 0:
             return
         self._state.fuel_in_flight -= count
-        self._state.fuel_in_transit += count
-        return_time = current_time + FUEL_MISS_RECOVERY_TIME
-        self._state.transit_queue.append((return_time, count))
+        self._schedule_return(count, current_time, FUEL_MISS_RECOVERY_TICKS)
+
+    def _schedule_return(self, count: int, current_time: float, delay_ticks: int) -> None:
+        """Put *count* fuel on the transit ring, due back *delay_ticks* from now."""
+        state = self._state
+        now = _to_tick(current_time)
+        if now > state.transit_tick:
+            # Drain and advance the cursor first: a slot is only safe to
+            # fill once every tick before *now* has been released, else the
+            # ring would hand this fuel back on an earlier lap.
+            self._process_transit_queue(current_time)
+        state.fuel_in_transit += count
+        state.transit_buckets[(now + delay_ticks) % _TRANSIT_RING_SIZE] += count
 
     # ------------------------------------------------------------------
     # Fuel Intake
@@ -263,36 +313,34 @@ class FieldManager:
         -------
         int
             Actual number of fuel balls acquired (0 <= result <= amount).
+
+        Raises
+        ------
+        ValueError
+            If *zone* is the outpost and *alliance* is not red or blue.
         """
         if amount <= 0:
             return 0
 
-        # Normalise enum values to strings for comparison
-        zone_str = zone.value if hasattr(zone, "value") else str(zone)
-        alliance_str = alliance.value if hasattr(alliance, "value") else str(alliance)
-
-        if zone_str in ("neutral", "alliance", "midfield"):
-            available = self._state.neutral_fuel_available
-            actual = min(amount, available)
-            self._state.neutral_fuel_available -= actual
+        # RobotZone is a str enum, so this matches both forms.  Every other
+        # zone (neutral, alliance, midfield, or unknown) draws from neutral.
+        # An empty pool (common during late-match starvation) returns at once.
+        if zone == "outpost":
+            outpost = self._state.outpost_fuel
+            i = _ALLIANCE_IDX[alliance]
+            available = outpost[i]
+            if not available:
+                return 0
+            actual = amount if amount < available else available
+            outpost[i] = available - actual
             return actual
 
-        if zone_str == "outpost":
-            if alliance_str == "red":
-                available = self._state.red_outpost_fuel
-                actual = min(amount, available)
-                self._state.red_outpost_fuel -= actual
-                return actual
-            else:
-                available = self._state.blue_outpost_fuel
-                actual = min(amount, available)
-                self._state.blue_outpost_fuel -= actual
-                return actual
-
-        # Unknown zone -- draw from neutral as fallback.
-        available = self._state.neutral_fuel_available
-        actual = min(amount, available)
-        self._state.neutral_fuel_available -= actual
+        state = self._state
+        available = state.neutral_fuel_available
+        if not available:
+            return 0
+        actual = amount if amount < available else available
+        state.neutral_fuel_available = available - actual
         return actual
 
     # ------------------------------------------------------------------
@@ -324,38 +372,24 @@ class FieldManager:
         if amount <= 0:
             return 0
 
-        # Determine how many we can actually pick up from the source.
-        if from_zone == "neutral":
-            available = self._state.neutral_fuel_available
-            actual_moved = min(amount, available)
-            self._state.neutral_fuel_available -= actual_moved
-        elif from_zone == "outpost":
-            # Pushing from outpost is unusual but supported.
-            # We treat it as red/blue agnostic here; caller should use
-            # try_intake for outpost-specific draws.  Default to neutral.
-            available = self._state.neutral_fuel_available
-            actual_moved = min(amount, available)
-            self._state.neutral_fuel_available -= actual_moved
-        else:
+        # Outpost pushes are treated as neutral draws (caller should use
+        # try_intake for outpost-specific draws); other sources are invalid.
+        if from_zone != "neutral" and from_zone != "outpost":
             return 0
 
-        if actual_moved <= 0:
+        available = self._state.neutral_fuel_available
+        if available <= 0:
             return 0
+        actual_moved = amount if amount < available else available
 
-        # Apply scatter loss.
-        scattered = int(math.floor(actual_moved * PUSH_SCATTER_RATE))
-        arrived = actual_moved - scattered
-
-        # Scattered fuel goes back to neutral zone (still on field, just not
-        # in a useful pile).
-        self._state.neutral_fuel_available += scattered
+        # Scatter loss, in exact integer arithmetic (floor of 20%).
+        scattered = actual_moved * PUSH_SCATTER_NUM // PUSH_SCATTER_DEN
 
-        # Fuel that arrives at the destination zone.  If the destination is
-        # "neutral" or "alliance", it ends up in the neutral pool (alliance
-        # zone is just a conceptual area; fuel is pickable from neutral).
-        self._state.neutral_fuel_available += arrived
-
-        return arrived
+        # Both the scattered fuel and the fuel that arrives end up back in the
+        # neutral pool ("alliance" is a conceptual area; fuel is pickable from
+        # neutral), so the pool's count is unchanged -- only the useful pile
+        # size returned to the caller is reduced.
+        return actual_moved - scattered
 
     # ------------------------------------------------------------------
     # Human Player Actions
@@ -377,16 +411,17 @@ class FieldManager:
             ``"red"`` or ``"blue"``.
         current_time : float
             Current elapsed match time in seconds.
-        """
-        if alliance == "red":
-            if self._state.red_outpost_fuel <= 0:
-                return
-            self._state.red_outpost_fuel -= 1
-        else:
-            if self._state.blue_outpost_fuel <= 0:
-                return
-            self._state.blue_outpost_fuel -= 1
 
+        Raises
+        ------
+        ValueError
+            If *alliance* is not red or blue.
+        """
+        outpost = self._state.outpost_fuel
+        i = _ALLIANCE_IDX[alliance]
+        if outpost[i] <= 0:
+            return
+        outpost[i] -= 1
         self._state.fuel_in_flight += 1
 
     def hp_feed(self, alliance: str) -> bool:
@@ -404,17 +439,18 @@ class FieldManager:
         -------
         bool
             True if fuel was available and fed; False if the outpost is empty.
+
+        Raises
+        ------
+        ValueError
+            If *alliance* is not red or blue.
         """
-        if alliance == "red":
-            if self._state.red_outpost_fuel <= 0:
-                return False
-            self._state.red_outpost_fuel -= 1
-            return True
-        else:
-            if self._state.blue_outpost_fuel <= 0:
-                return False
-            self._state.blue_outpost_fuel -= 1
-            return True
+        outpost = self._state.outpost_fuel
+        i = _ALLIANCE_IDX[alliance]
+        if outpost[i] <= 0:
+            return False
+        outpost[i] -= 1
+        return True
 
     # ------------------------------------------------------------------
     # Tower / Climbing
@@ -438,12 +474,13 @@ class FieldManager:
         bool
             True if the robot may climb (tower not full, or robot already
             on tower).
+
+        Raises
+        ------
+        ValueError
+            If *alliance* is not red or blue.
         """
-        occupants = (
-            self._state.red_tower_occupants
-            if alliance == "red"
-            else self._state.blue_tower_occupants
-        )
+        occupants = self._state.tower_occupants[_ALLIANCE_IDX[alliance]]
         if robot_id in occupants:
             return True  # Already registered.
         return len(occupants) < MAX_TOWER_OCCUPANTS
@@ -460,12 +497,13 @@ class FieldManager:
             ``"red"`` or ``"blue"``.
         robot_id : str
             Unique robot identifier.
+
+        Raises
+        ------
+        ValueError
+            If *alliance* is not red or blue.
         """
-        occupants = (
-            self._state.red_tower_occupants
-            if alliance == "red"
-            else self._state.blue_tower_occupants
-        )
+        occupants = self._state.tower_occupants[_ALLIANCE_IDX[alliance]]
         if robot_id not in occupants:
             occupants.append(robot_id)
 
@@ -489,13 +527,26 @@ class FieldManager:
         AssertionError
             If the total fuel count does not equal TOTAL_FUEL.
         """
-        total = self._state.total_fuel_check(robots)
-        assert total == TOTAL_FUEL, (
-            f"Fuel conservation violated: counted {total}, expected {TOTAL_FUEL}. "
-            f"neutral={self._state.neutral_fuel_available}, "
-            f"red_outpost={self._state.red_outpost_fuel}, "
-            f"blue_outpost={self._state.blue_outpost_fuel}, "
-            f"in_flight={self._state.fuel_in_flight}, "
-            f"in_transit={self._state.fuel_in_transit}, "
-            f"in_robots={sum(r.fuel_held + r.fuel_being_pushed for r in robots)}"
+        # Development check only: ``python -O`` skips the robot sum too,
+        # not just the assert below.
+        if not __debug__:
+            return
+        state = self._state
+        red_outpost, blue_outpost = state.outpost_fuel
+        in_robots = 0
+        for r in robots:
+            in_robots += r.fuel_held + r.fuel_being_pushed
+        total = (
+            state.neutral_fuel_available + red_outpost + blue_outpost
+            + state.fuel_in_flight + state.fuel_in_transit + in_robots
         )
+        if total != TOTAL_FUEL:
+            raise AssertionError(
+                f"Fuel conservation violated: counted {total}, expected {TOTAL_FUEL}. "
+                f"neutral={state.neutral_fuel_available}, "
+                f"red_outpost={red_outpost}, "
+                f"blue_outpost={blue_outpost}, "
+                f"in_flight={state.fuel_in_flight}, "
+                f"in_transit={state.fuel_in_transit}, "
+                f"in_robots={in_robots}"
+            )
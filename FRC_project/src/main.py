@@ -19,6 +19,9 @@ Examples:
     python -m src.main --red elite_turret,strong_scorer,everybot --blue everybot,everybot,kitbot_plus \
                        --num-sims 1000 --seed 42
 
+    # Monte Carlo on 4 worker processes
+    python -m src.main --num-sims 1000 --workers 4
+
     # Output JSON
     python -m src.main --output json
 
@@ -32,14 +35,12 @@ import argparse
 import sys
 from pathlib import Path
 
-from src.config import ARCHETYPE_DEFAULTS
+from src.archetypes import ARCHETYPE_DEFAULTS
 from src.strategy import (
     create_alliance_config,
     parse_alliance_string,
     select_counter_strategy,
 )
-from src.stats import MonteCarloRunner, format_summary, to_json, to_csv_header, to_csv_row
-from src.match_engine import MatchEngine
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -98,6 +99,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=42,
         help="Base random seed (default: 42).",
     )
+    parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=None,
+        help="Worker processes for Monte Carlo runs (default: all CPUs; 1 = serial).",
+    )
 
     # Single match mode
     parser.add_argument(
@@ -164,7 +171,10 @@ def main(argv: list[str] | None = None) -> int:
     print()
 
     if args.single:
-        # Single match mode
+        # Single match mode.  Imported here so --help and argument errors
+        # skip loading the engine.
+        from src.match_engine import MatchEngine
+
         engine = MatchEngine(red_alliance, blue_alliance, seed=args.seed)
         result = engine.run()
 
@@ -185,13 +195,24 @@ def main(argv: list[str] | None = None) -> int:
 
         return 0
 
-    # Monte Carlo mode
+    # Monte Carlo mode.  src.stats pulls in NumPy and the engine, so it is
+    # imported here rather than at module level; --help and --single never
+    # need it.
+    from src.stats import (
+        MonteCarloRunner,
+        format_summary,
+        to_csv_header,
+        to_csv_row,
+        to_json,
+    )
+
     print(f"Running {args.num_sims} simulations (seed={args.seed})...")
     runner = MonteCarloRunner(
         red_alliance=red_alliance,
         blue_alliance=blue_alliance,
         num_simulations=args.num_sims,
         base_seed=args.seed,
+        workers=args.workers,
     )
     stats = runner.run()
 
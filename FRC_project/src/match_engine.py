@@ -12,8 +12,10 @@ Central simulation loop that coordinates all subsystems:
 
 from __future__ import annotations
 
+import os
 import random
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from src.models import (
     Alliance,
@@ -47,6 +49,7 @@ from src.config import (
     TECH_FOUL_POINTS,
     TICK_INTERVAL,
     TOTAL_MATCH_DURATION,
+    TOTAL_MATCH_TICKS,
     TOWER_L1_AUTO_POINTS,
     TOWER_L1_TELEOP_POINTS,
     TOWER_L2_POINTS,
@@ -74,6 +77,24 @@ _PHASE_BOUNDARIES = [
     (0.0,   30.0,  Phase.ENDGAME),      # elapsed 130-160
 ]
 
+# Index of each alliance in the engine's [red, blue] accumulators.
+_RED, _BLUE = 0, 1
+_SIDE_NAMES = ("red", "blue")
+
+# Actions whose held fuel is resolved as shots each tick.
+_SHOOTING_ACTIONS = (RobotAction.SHOOTING, RobotAction.DUMPING)
+
+# Defense target when a defender's config names none: the opponent's first robot.
+_DEFAULT_DEFENSE_TARGET = {Alliance.RED: "blue_0", Alliance.BLUE: "red_0"}
+
+# Enum members read every tick, bound once (Enum class attribute access is
+# slow; see the matching note in robot.py).
+_NO_HP_PHASES = (Phase.AUTO, Phase.TRANSITION)
+_DEFENDING = RobotAction.DEFENDING
+_HP_THROW, _HP_FEED, _HP_MIXED = (
+    HumanPlayerMode.THROW, HumanPlayerMode.FEED, HumanPlayerMode.MIXED,
+)
+
 
 def _get_phase(time_remaining: float) -> Phase:
     """Determine the current match phase from time_remaining."""
@@ -86,15 +107,40 @@ def _get_phase(time_remaining: float) -> Phase:
     return Phase.ENDGAME
 
 
+# Phase at the start of each tick, so the match loop indexes instead of scanning.
+_PHASE_BY_TICK = tuple(
+    _get_phase(TOTAL_MATCH_DURATION - tick * TICK_INTERVAL)
+    for tick in range(TOTAL_MATCH_TICKS)
+)
+
+# Row order of the per-phase [red, blue] score table.
+_PHASES = tuple(Phase)
+
+
 class MatchEngine:
     """Runs a single FRC 2026 REBUILT match simulation."""
 
+    __slots__ = (
+        "rng", "red_config", "blue_config", "field", "match_state",
+        "red_robots", "blue_robots", "all_robots",
+        "_robot_states", "_robot_sides", "_robot_by_id", "_robot_columns",
+        "_defense_targets",
+        "_score", "_fuel_scored", "_tower_points", "_penalty_points",
+        "_phase_points", "_phase_bucket", "_hub_active",
+        "_hp_timers", "_hp_lanes", "_defense_applied",
+        "_red_auto_score", "_blue_auto_score", "_auto_winner",
+        "_prev_foul_counts",
+    )
+
     def __init__(
         self,
         red_alliance: AllianceConfig,
         blue_alliance: AllianceConfig,
         seed: int = 0,
     ) -> None:
+        # random.Random rather than a NumPy Generator: draws here are scalar
+        # (1-5 per volley), and Generator.random()/binomial() cost far more
+        # per call than Random.random() at that size.
         self.rng = random.Random(seed)
         self.red_config = red_alliance
         self.blue_config = blue_alliance
@@ -111,8 +157,8 @@ class MatchEngine:
         )
 
         # Create robots: 3 red + 3 blue
-        self.red_robots: List[Robot] = []
-        self.blue_robots: List[Robot] = []
+        red_robots: List[Robot] = []
+        blue_robots: List[Robot] = []
 
         for i, cfg in enumerate(red_alliance.robots):
             robot = Robot(
@@ -121,7 +167,7 @@ class MatchEngine:
                 config=cfg,
                 rng=random.Random(self.rng.randint(0, 2**31)),
             )
-            self.red_robots.append(robot)
+            red_robots.append(robot)
 
         for i, cfg in enumerate(blue_alliance.robots):
             robot = Robot(
@@ -130,31 +176,61 @@ class MatchEngine:
                 config=cfg,
                 rng=random.Random(self.rng.randint(0, 2**31)),
             )
-            self.blue_robots.append(robot)
-
-        self.all_robots: List[Robot] = self.red_robots + self.blue_robots
+            blue_robots.append(robot)
+
+        # Fixed for the whole match, so stored as tuples (red first).
+        self.red_robots: Tuple[Robot, ...] = tuple(red_robots)
+        self.blue_robots: Tuple[Robot, ...] = tuple(blue_robots)
+        self.all_robots: Tuple[Robot, ...] = self.red_robots + self.blue_robots
+
+        # Per-robot columns parallel to all_robots (structure of arrays).
+        # Robot.state is never reassigned, so the references stay valid.
+        self._robot_states: List[RobotState] = [r.get_state() for r in self.all_robots]
+        self._robot_sides: List[int] = [
+            _RED if r.alliance == Alliance.RED else _BLUE for r in self.all_robots
+        ]
+        self._robot_by_id: Dict[str, Robot] = {r.robot_id: r for r in self.all_robots}
+        self._robot_columns = tuple(zip(self.all_robots, self._robot_states, self._robot_sides))
+        # Robot each one defends, resolved from its config once; None when
+        # the configured id names no robot in this match.
+        self._defense_targets: List[Optional[Robot]] = [
+            self._robot_by_id.get(
+                r.config.defense_target or _DEFAULT_DEFENSE_TARGET[r.alliance]
+            )
+            for r in self.all_robots
+        ]
 
         # Distribute preloaded fuel across robots
         self._distribute_preload(self.red_robots, INITIAL_PRELOAD_FUEL)
         self._distribute_preload(self.blue_robots, INITIAL_PRELOAD_FUEL)
 
-        # Scoring accumulators
-        self.red_fuel_scored: int = 0
-        self.blue_fuel_scored: int = 0
-        self.red_tower_points: int = 0
-        self.blue_tower_points: int = 0
-        self.red_penalty_points: int = 0   # penalty points awarded TO red (from blue fouls)
-        self.blue_penalty_points: int = 0  # penalty points awarded TO blue (from red fouls)
-
-        # Phase score tracking
-        self.phase_scores: Dict[str, Dict[str, int]] = {}
-
-        # HP timing
-        self._red_hp_timer: float = 0.0
-        self._blue_hp_timer: float = 0.0
+        # Scoring accumulators, indexed [_RED, _BLUE].  These are authoritative
+        # during the match; match_state is synced from them at phase changes.
+        self._score: List[int] = [0, 0]
+        self._fuel_scored: List[int] = [0, 0]
+        self._tower_points: List[int] = [0, 0]
+        self._penalty_points: List[int] = [0, 0]   # penalty points awarded TO each side
+
+        # Phase score tracking: one [red, blue] row per Phase, in enum order
+        self._phase_points: List[List[int]] = [[0, 0] for _ in _PHASES]
+        # Row for the current phase; rebound only in _on_phase_change
+        self._phase_bucket: List[int] = self._phase_points[_PHASES.index(Phase.AUTO)]
+
+        # Hub activation cache, indexed [_RED, _BLUE]; kept in step with
+        # match_state by _set_hub_activation so hot paths skip the branch.
+        self._hub_active: List[bool] = [True, True]
+
+        # HP timing, indexed [_RED, _BLUE]
+        self._hp_timers: List[float] = [0.0, 0.0]
+
+        # (side, HP mode, robots) per alliance, fixed for the match
+        self._hp_lanes: Tuple[Tuple[int, HumanPlayerMode, Tuple[Robot, ...]], ...] = (
+            (_RED, red_alliance.human_player_mode, self.red_robots),
+            (_BLUE, blue_alliance.human_player_mode, self.blue_robots),
+        )
 
         # Defense tracking: which robots are being defended (to apply/reset penalties)
-        self._defense_applied: Dict[str, bool] = {}
+        self._defense_applied: Set[str] = set()
 
         # Auto scores for determining hub activation
         self._red_auto_score: int = 0
@@ -165,6 +241,47 @@ class MatchEngine:
         for robot in self.all_robots:
             self._prev_foul_counts[robot.robot_id] = 0
 
+    # ------------------------------------------------------------------
+    # Batch execution
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def run_batch(
+        cls,
+        specs: Iterable[Tuple[AllianceConfig, AllianceConfig, int]],
+        workers: Optional[int] = None,
+    ) -> List[SimulationResult]:
+        """Run independent matches, spreading them across worker processes.
+
+        Workers are reused for every chunk they receive, so import-time
+        setup (archetype specs, the per-tick phase tables) is paid once per
+        worker process rather than once per match.
+
+        Parameters
+        ----------
+        specs : iterable of (red_alliance, blue_alliance, seed)
+            One entry per match.
+        workers : int, optional
+            Number of worker processes (default: all CPUs).  With one
+            worker, or a single match, everything runs in-process.
+
+        Returns
+        -------
+        list of SimulationResult
+            Results in the same order as *specs*.
+        """
+        specs = list(specs)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(specs))
+        if workers <= 1:
+            return [_run_spec(spec) for spec in specs]
+
+        # Several chunks per worker balances load without per-match IPC.
+        chunksize = max(1, -(-len(specs) // (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_run_spec, specs, chunksize=chunksize))
+
     # ------------------------------------------------------------------
     # Main simulation loop
     # ------------------------------------------------------------------
@@ -172,50 +289,59 @@ class MatchEngine:
     def run(self) -> SimulationResult:
         """Run the full match simulation and return results."""
         dt = TICK_INTERVAL
-        current_phase_name = ""
 
-        while self.match_state.time_remaining > 0:
+        # Bind per-match invariants to locals once; the loop body below runs
+        # TOTAL_MATCH_TICKS times and would otherwise re-read each attribute.
+        match_state = self.match_state
+        field = self.field
+        robot_columns = self._robot_columns
+        robot_states = self._robot_states
+        resolve_shooting = self._resolve_shooting
+        process_fouls = self._process_fouls
+        shooting_actions = _SHOOTING_ACTIONS
+
+        # Drive the loop by integer tick index; times are derived from it so
+        # no floating-point error accumulates across the match.
+        for tick in range(TOTAL_MATCH_TICKS):
             # Determine phase
-            new_phase = _get_phase(self.match_state.time_remaining)
+            new_phase = _PHASE_BY_TICK[tick]
 
             # Phase transition handling
-            if new_phase != self.match_state.current_phase:
-                self._on_phase_change(self.match_state.current_phase, new_phase)
-                self.match_state.current_phase = new_phase
-
-            # Track phase scores
-            phase_key = new_phase.value
-            if phase_key not in self.phase_scores:
-                self.phase_scores[phase_key] = {"red": 0, "blue": 0}
+            if new_phase is not match_state.current_phase:
+                self._on_phase_change(match_state.current_phase, new_phase)
+                match_state.current_phase = new_phase
 
             # Elapsed time for field transit queue
-            elapsed = TOTAL_MATCH_DURATION - self.match_state.time_remaining
+            elapsed = tick * dt
 
-            # 1. Update field state (transit queue, congestion)
-            all_states = [r.get_state() for r in self.all_robots]
-            self.field.tick(elapsed, all_states)
+            # 1. Update field state (transit queue, congestion).  Robots
+            #    mutate their state in place, so the list built in
+            #    __init__ stays current.
+            field.tick(elapsed, robot_states)
 
             # 2. Process human player actions
             self._process_human_players(dt, elapsed)
 
-            # 3. Update all robots
-            for robot in self.all_robots:
-                robot.tick(self.match_state, self.field, dt)
-
-            # 4. Resolve shooting and scoring
-            self._resolve_shooting(elapsed)
-
-            # 5. Process defense interactions
+            # 3. Update each robot, then resolve its shots and fouls in the
+            #    same pass.  Robots never read each other's state or the
+            #    scores, and engine RNG draws stay in robot order, so this
+            #    is equivalent to separate passes over all robots.
+            for robot, state, side in robot_columns:
+                robot.tick(match_state, field, dt)
+                if state.current_action in shooting_actions:
+                    resolve_shooting(robot, state, side, elapsed)
+                if state.fouls_drawn_this_match:
+                    process_fouls(robot, state, side)
+
+            # 4. Process defense interactions (needs every robot's action)
             self._process_defense()
 
-            # 6. Process fouls
-            self._process_fouls()
-
             # Advance time
-            self.match_state.time_remaining -= dt
+            match_state.time_remaining = TOTAL_MATCH_DURATION - (tick + 1) * dt
 
         # End of match: resolve tower climbing
         self._resolve_tower_climbing()
+        self._sync_match_state()
 
         # Compile result
         return self._compile_result()
@@ -226,6 +352,9 @@ class MatchEngine:
 
     def _on_phase_change(self, old_phase: Phase, new_phase: Phase) -> None:
         """Handle a phase transition."""
+        self._sync_match_state()
+        self._phase_bucket = self._phase_points[_PHASES.index(new_phase)]
+
         if old_phase == Phase.AUTO and new_phase == Phase.TRANSITION:
             # Determine auto winner and set hub activation
             self._determine_auto_winner()
@@ -235,13 +364,11 @@ class MatchEngine:
 
         if new_phase == Phase.ENDGAME:
             # Both hubs active during endgame
-            self.match_state.red_hub_active = True
-            self.match_state.blue_hub_active = True
+            self._set_hub_activation(True, True)
 
     def _determine_auto_winner(self) -> None:
         """Compare auto scores to determine which alliance won auto."""
-        self._red_auto_score = self.red_fuel_scored
-        self._blue_auto_score = self.blue_fuel_scored
+        self._red_auto_score, self._blue_auto_score = self._fuel_scored
 
         # Auto winner determination: the alliance that scored more fuel
         # Per spec: If auto winner is Red, Red Hub is INACTIVE during Shifts 1&3
@@ -265,99 +392,76 @@ class MatchEngine:
         loser_active = not winner_active
 
         if winner == "red":
-            self.match_state.red_hub_active = winner_active
-            self.match_state.blue_hub_active = loser_active
+            self._set_hub_activation(winner_active, loser_active)
         else:
-            self.match_state.red_hub_active = loser_active
-            self.match_state.blue_hub_active = winner_active
+            self._set_hub_activation(loser_active, winner_active)
+
+    def _set_hub_activation(self, red_active: bool, blue_active: bool) -> None:
+        """Set both hubs' activation on match_state and the per-side cache."""
+        self.match_state.red_hub_active = red_active
+        self.match_state.blue_hub_active = blue_active
+        self._hub_active[_RED] = red_active
+        self._hub_active[_BLUE] = blue_active
 
     # ------------------------------------------------------------------
     # Shooting resolution
     # ------------------------------------------------------------------
 
-    def _resolve_shooting(self, elapsed: float) -> None:
-        """Resolve shots for robots that are currently shooting or just finished.
+    def _resolve_shooting(
+        self, robot: Robot, state: RobotState, side: int, elapsed: float
+    ) -> None:
+        """Resolve one robot's shots for this tick.
 
-        For each robot in SHOOTING or DUMPING action with fuel, perform
-        Bernoulli accuracy trials and update scores.
+        Called for a robot in SHOOTING or DUMPING action: releases up to
+        its per-tick shot count, performs Bernoulli accuracy trials and
+        updates scores.
         """
-        for robot in self.all_robots:
-            state = robot.get_state()
-
-            if state.current_action not in (RobotAction.SHOOTING, RobotAction.DUMPING):
-                continue
-
-            if state.fuel_held <= 0:
-                continue
-
-            # Determine how much fuel to resolve this tick
-            # For shooting: resolve based on shoot rate * dt
-            rate = robot.get_shoot_rate()
-            if rate <= 0:
-                continue
-
-            fuel_this_tick = min(
-                state.fuel_held,
-                max(1, int(rate * TICK_INTERVAL + 0.5)),
-            )
-
-            # Determine if hub is active
-            alliance = state.alliance
-            hub_active = (
-                self.match_state.red_hub_active
-                if alliance == Alliance.RED
-                else self.match_state.blue_hub_active
-            )
-
-            accuracy = robot.get_accuracy()
-            hits = 0
-            misses = 0
-
-            for _ in range(fuel_this_tick):
-                if state.fuel_held <= 0:
-                    break
-                state.fuel_held -= 1
-
-                # Notify field: fuel is now in flight
-                self.field.fuel_shot(1)
+        fuel_held = state.fuel_held
+        if fuel_held <= 0:
+            return
 
-                # Bernoulli accuracy trial
-                if self.rng.random() < accuracy:
-                    hits += 1
-                else:
-                    misses += 1
-
-            # Process hits
-            if hits > 0:
-                alliance_str = alliance.value
-                self.field.fuel_scored(alliance_str, hits, elapsed)
-
-                if hub_active:
-                    points = hits * FUEL_ACTIVE_HUB_POINTS
-                    if alliance == Alliance.RED:
-                        self.red_fuel_scored += hits
-                        self.match_state.red_fuel_scored += hits
-                        self.match_state.red_score += points
-                    else:
-                        self.blue_fuel_scored += hits
-                        self.match_state.blue_fuel_scored += hits
-                        self.match_state.blue_score += points
-
-                    # Track phase scores
-                    phase_key = self.match_state.current_phase.value
-                    if phase_key in self.phase_scores:
-                        if alliance == Alliance.RED:
-                            self.phase_scores[phase_key]["red"] += points
-                        else:
-                            self.phase_scores[phase_key]["blue"] += points
-                else:
-                    # Inactive hub: fuel enters but scores 0
-                    # Still goes through transit for recycling
-                    pass
+        # Determine how much fuel to resolve this tick
+        # For shooting: resolve based on shoot rate * dt (precomputed)
+        shots_per_tick = robot.get_shots_per_tick()
+        if shots_per_tick <= 0:
+            return
 
-            # Process misses
-            if misses > 0:
-                self.field.fuel_missed(misses, elapsed)
+        fuel_this_tick = fuel_held if fuel_held < shots_per_tick else shots_per_tick
+        field = self.field
+
+        # Release the whole volley at once; fuel is now in flight.
+        state.fuel_held = fuel_held - fuel_this_tick
+        field.fuel_shot(fuel_this_tick)
+
+        # One Bernoulli accuracy trial per ball, in shot order.  Batching the
+        # volley into one getrandbits() call and unpacking 16-bit lanes was
+        # measured slower for the 2-5 ball volleys that dominate (bit
+        # extraction in Python outweighs the saved calls), as is a NumPy draw
+        # at this size; both would also change every seeded result.
+        accuracy = robot.get_accuracy()
+        rand = self.rng.random
+        hits = 0
+        for _ in range(fuel_this_tick):
+            if rand() < accuracy:
+                hits += 1
+        misses = fuel_this_tick - hits
+
+        # Process hits
+        if hits > 0:
+            field.fuel_scored(_SIDE_NAMES[side], hits, elapsed)
+
+            # Inactive hub: fuel enters but scores 0 (still recycles via transit)
+            if self._hub_active[side]:
+                points = hits * FUEL_ACTIVE_HUB_POINTS
+                self._fuel_scored[side] += hits
+                self._score[side] += points
+
+                # Track phase scores
+                self._phase_bucket[side] += points
+
+        # Process misses
+        if misses > 0:
+            field.fuel_missed(misses, elapsed)
 
     # ------------------------------------------------------------------
     # Defense
@@ -365,34 +469,25 @@ class MatchEngine:
 
     def _process_defense(self) -> None:
         """Apply defense penalties from defending robots to their targets."""
-        # Collect all defending robots
-        defenders: List[Robot] = []
-        for robot in self.all_robots:
-            state = robot.get_state()
-            if state.is_defending and state.current_action == RobotAction.DEFENDING:
-                defenders.append(robot)
+        # Collect the targets of all defending robots, in robot order
+        targets: List[Robot] = []
+        for state, target in zip(self._robot_states, self._defense_targets):
+            if target is not None and state.is_defending and state.current_action is _DEFENDING:
+                targets.append(target)
+
+        # Quiescent tick: nobody defending and no penalty left to reset
+        if not targets and not self._defense_applied:
+            return
 
         # Build set of currently defended robot IDs
         currently_defended = set()
 
-        for defender in defenders:
-            target_id = defender.config.defense_target
-            if not target_id:
-                # Default: defend the opponent's best scorer (first robot)
-                if defender.alliance == Alliance.RED:
-                    target_id = "blue_0"
-                else:
-                    target_id = "red_0"
-
-            # Find the target robot
-            target = self._find_robot(target_id)
-            if target is None:
-                continue
-
+        for target in targets:
+            target_id = target.robot_id
             currently_defended.add(target_id)
 
             # Apply defense penalty if not already applied
-            if not self._defense_applied.get(target_id, False):
+            if target_id not in self._defense_applied:
                 if target.is_turret():
                     target.apply_defense_penalty(
                         DEFENSE_CYCLE_HIT_TURRET, DEFENSE_ACCURACY_HIT_TURRET
@@ -401,56 +496,41 @@ class MatchEngine:
                     target.apply_defense_penalty(
                         DEFENSE_CYCLE_HIT_FIXED, DEFENSE_ACCURACY_HIT_FIXED
                     )
-                self._defense_applied[target_id] = True
+                self._defense_applied.add(target_id)
 
         # Remove defense penalties from robots no longer being defended
-        for robot_id, is_defended in list(self._defense_applied.items()):
-            if is_defended and robot_id not in currently_defended:
-                target = self._find_robot(robot_id)
-                if target:
-                    target.reset_defense_penalty()
-                self._defense_applied[robot_id] = False
+        for robot_id in self._defense_applied - currently_defended:
+            target = self._find_robot(robot_id)
+            if target:
+                target.reset_defense_penalty()
+        self._defense_applied &= currently_defended
 
     def _find_robot(self, robot_id: str) -> Optional[Robot]:
-        """Find a robot by its ID."""
-        for robot in self.all_robots:
-            if robot.robot_id == robot_id:
-                return robot
-        # Handle "opponent_0" style targets
-        if robot_id.startswith("opponent_"):
-            return None
-        return None
+        """Find a robot by its ID (None for unknown or "opponent_N" style targets)."""
+        return self._robot_by_id.get(robot_id)
 
     # ------------------------------------------------------------------
     # Fouls
     # ------------------------------------------------------------------
 
-    def _process_fouls(self) -> None:
-        """Check for new fouls from defending robots and award penalty points."""
-        for robot in self.all_robots:
-            state = robot.get_state()
-            current_fouls = state.fouls_drawn_this_match
-            prev_fouls = self._prev_foul_counts.get(robot.robot_id, 0)
-
-            if current_fouls > prev_fouls:
-                new_fouls = current_fouls - prev_fouls
-                self._prev_foul_counts[robot.robot_id] = current_fouls
-
-                # Fouls by this robot award points to the opponent
-                # Simplified: each new foul = FOUL_POINTS to opponent
-                # (mix of regular and tech fouls)
-                penalty_pts = new_fouls * FOUL_POINTS
-
-                if robot.alliance == Alliance.RED:
-                    # Red robot fouled -> points to blue
-                    self.blue_penalty_points += penalty_pts
-                    self.match_state.red_penalties += penalty_pts
-                    self.match_state.blue_score += penalty_pts
-                else:
-                    # Blue robot fouled -> points to red
-                    self.red_penalty_points += penalty_pts
-                    self.match_state.blue_penalties += penalty_pts
-                    self.match_state.red_score += penalty_pts
+    def _process_fouls(self, robot: Robot, state: RobotState, side: int) -> None:
+        """Award penalty points for any new fouls drawn by one robot."""
+        current_fouls = state.fouls_drawn_this_match
+        prev_fouls = self._prev_foul_counts.get(robot.robot_id, 0)
+
+        if current_fouls > prev_fouls:
+            new_fouls = current_fouls - prev_fouls
+            self._prev_foul_counts[robot.robot_id] = current_fouls
+
+            # Fouls by this robot award points to the opponent
+            # Simplified: each new foul = FOUL_POINTS to opponent
+            # (mix of regular and tech fouls)
+            penalty_pts = new_fouls * FOUL_POINTS
+
+            # A foul by one side awards its points to the other
+            opponent = 1 - side
+            self._penalty_points[opponent] += penalty_pts
+            self._score[opponent] += penalty_pts
 
     # ------------------------------------------------------------------
     # Human player
@@ -458,67 +538,47 @@ class MatchEngine:
 
     def _process_human_players(self, dt: float, elapsed: float) -> None:
         """Process human player actions based on alliance HP mode."""
-        phase = self.match_state.current_phase
-        if phase in (Phase.AUTO, Phase.TRANSITION):
+        if self.match_state.current_phase in _NO_HP_PHASES:
             return  # No HP actions during auto/transition
 
-        self._process_hp_for_alliance(
-            Alliance.RED, self.red_config.human_player_mode,
-            self.red_robots, dt, elapsed,
-        )
-        self._process_hp_for_alliance(
-            Alliance.BLUE, self.blue_config.human_player_mode,
-            self.blue_robots, dt, elapsed,
-        )
+        for side, hp_mode, robots in self._hp_lanes:
+            self._process_hp_for_alliance(side, hp_mode, robots, dt, elapsed)
 
     def _process_hp_for_alliance(
         self,
-        alliance: Alliance,
+        side: int,
         hp_mode: HumanPlayerMode,
-        robots: List[Robot],
+        robots: Sequence[Robot],
         dt: float,
         elapsed: float,
     ) -> None:
         """Process HP actions for one alliance."""
-        if alliance == Alliance.RED:
-            timer = self._red_hp_timer
-        else:
-            timer = self._blue_hp_timer
+        timer = self._hp_timers[side] + dt
 
-        timer += dt
-        alliance_str = alliance.value
-
-        if hp_mode == HumanPlayerMode.THROW:
+        if hp_mode == _HP_THROW:
             if timer >= HP_THROW_INTERVAL:
                 timer -= HP_THROW_INTERVAL
-                self._hp_throw(alliance_str, elapsed)
-        elif hp_mode == HumanPlayerMode.FEED:
+                self._hp_throw(side, elapsed)
+        elif hp_mode == _HP_FEED:
             if timer >= HP_FEED_INTERVAL:
                 timer -= HP_FEED_INTERVAL
-                self._hp_feed(alliance_str, robots)
-        elif hp_mode == HumanPlayerMode.MIXED:
+                self._hp_feed(side, robots)
+        elif hp_mode == _HP_MIXED:
             # Alternate: throw when hub active, feed when inactive
-            hub_active = (
-                self.match_state.red_hub_active
-                if alliance == Alliance.RED
-                else self.match_state.blue_hub_active
-            )
-            if hub_active:
+            if self._hub_active[side]:
                 if timer >= HP_THROW_INTERVAL:
                     timer -= HP_THROW_INTERVAL
-                    self._hp_throw(alliance_str, elapsed)
+                    self._hp_throw(side, elapsed)
             else:
                 if timer >= HP_FEED_INTERVAL:
                     timer -= HP_FEED_INTERVAL
-                    self._hp_feed(alliance_str, robots)
+                    self._hp_feed(side, robots)
 
-        if alliance == Alliance.RED:
-            self._red_hp_timer = timer
-        else:
-            self._blue_hp_timer = timer
+        self._hp_timers[side] = timer
 
-    def _hp_throw(self, alliance: str, elapsed: float) -> None:
+    def _hp_throw(self, side: int, elapsed: float) -> None:
         """Human player throws fuel at the Hub."""
+        alliance = _SIDE_NAMES[side]
         self.field.hp_throw(alliance, elapsed)
 
         # Resolve throw accuracy after flight time
@@ -527,31 +587,20 @@ class MatchEngine:
             # Hit
             self.field.fuel_scored(alliance, 1, elapsed)
 
-            hub_active = (
-                self.match_state.red_hub_active
-                if alliance == "red"
-                else self.match_state.blue_hub_active
-            )
-            if hub_active:
-                if alliance == "red":
-                    self.red_fuel_scored += 1
-                    self.match_state.red_fuel_scored += 1
-                    self.match_state.red_score += FUEL_ACTIVE_HUB_POINTS
-                else:
-                    self.blue_fuel_scored += 1
-                    self.match_state.blue_fuel_scored += 1
-                    self.match_state.blue_score += FUEL_ACTIVE_HUB_POINTS
+            if self._hub_active[side]:
+                self._fuel_scored[side] += 1
+                self._score[side] += FUEL_ACTIVE_HUB_POINTS
         else:
             # Miss
             self.field.fuel_missed(1, elapsed)
 
-    def _hp_feed(self, alliance: str, robots: List[Robot]) -> None:
+    def _hp_feed(self, side: int, robots: Sequence[Robot]) -> None:
         """Human player feeds fuel to a robot at the outpost."""
         # Find a robot that needs fuel and isn't full
         for robot in robots:
             state = robot.get_state()
             if state.fuel_held < state.storage_capacity:
-                if self.field.hp_feed(alliance):
+                if self.field.hp_feed(_SIDE_NAMES[side]):
                     state.fuel_held += 1
                 return
 
@@ -566,18 +615,16 @@ class MatchEngine:
         If a robot climbed L1 in auto and then climbed higher in endgame,
         only the higher level is counted (no double-counting).
         """
-        for robot in self.all_robots:
-            state = robot.get_state()
+        for robot, state, side in self._robot_columns:
             level = state.climb_level
             if level <= 0:
                 continue
 
             # Register climb on field
-            alliance_str = state.alliance.value
-            self.field.register_climb(alliance_str, robot.robot_id)
+            self.field.register_climb(_SIDE_NAMES[side], robot.robot_id)
 
             # Determine points based on level and whether scored in auto
-            auto_climbed = getattr(robot, '_auto_climb_scored', False)
+            auto_climbed = robot.scored_auto_climb()
 
             if level == 1 and auto_climbed:
                 # L1 scored during auto gets auto bonus points
@@ -591,14 +638,17 @@ class MatchEngine:
             else:
                 points = 0
 
-            if state.alliance == Alliance.RED:
-                self.red_tower_points += points
-                self.match_state.red_tower_points += points
-                self.match_state.red_score += points
-            else:
-                self.blue_tower_points += points
-                self.match_state.blue_tower_points += points
-                self.match_state.blue_score += points
+            self._tower_points[side] += points
+            self._score[side] += points
+
+    def _sync_match_state(self) -> None:
+        """Copy the [red, blue] accumulators onto the shared MatchState."""
+        ms = self.match_state
+        ms.red_score, ms.blue_score = self._score
+        ms.red_fuel_scored, ms.blue_fuel_scored = self._fuel_scored
+        ms.red_tower_points, ms.blue_tower_points = self._tower_points
+        # match_state records penalties by the side that committed them
+        ms.blue_penalties, ms.red_penalties = self._penalty_points
 
     # ------------------------------------------------------------------
     # Result compilation
@@ -606,8 +656,10 @@ class MatchEngine:
 
     def _compile_result(self) -> SimulationResult:
         """Build the final SimulationResult."""
-        red_total = self.match_state.red_score
-        blue_total = self.match_state.blue_score
+        red_total, blue_total = self._score
+        red_fuel, blue_fuel = self._fuel_scored
+        red_tower, blue_tower = self._tower_points
+        red_penalty_pts, blue_penalty_pts = self._penalty_points
 
         # Winner
         if red_total > blue_total:
@@ -630,10 +682,10 @@ class MatchEngine:
             blue_rp += RP_TIE
 
         # Fuel RP bonuses
-        red_energized = self.red_fuel_scored >= RP_ENERGIZED_THRESHOLD
-        red_supercharged = self.red_fuel_scored >= RP_SUPERCHARGED_THRESHOLD
-        blue_energized = self.blue_fuel_scored >= RP_ENERGIZED_THRESHOLD
-        blue_supercharged = self.blue_fuel_scored >= RP_SUPERCHARGED_THRESHOLD
+        red_energized = red_fuel >= RP_ENERGIZED_THRESHOLD
+        red_supercharged = red_fuel >= RP_SUPERCHARGED_THRESHOLD
+        blue_energized = blue_fuel >= RP_ENERGIZED_THRESHOLD
+        blue_supercharged = blue_fuel >= RP_SUPERCHARGED_THRESHOLD
 
         if red_energized:
             red_rp += 1
@@ -645,8 +697,8 @@ class MatchEngine:
             blue_rp += 1
 
         # Tower RP bonus
-        red_traversal = self.red_tower_points >= RP_TRAVERSAL_THRESHOLD
-        blue_traversal = self.blue_tower_points >= RP_TRAVERSAL_THRESHOLD
+        red_traversal = red_tower >= RP_TRAVERSAL_THRESHOLD
+        blue_traversal = blue_tower >= RP_TRAVERSAL_THRESHOLD
 
         if red_traversal:
             red_rp += 1
@@ -659,19 +711,22 @@ class MatchEngine:
             red_rp=red_rp,
             blue_rp=blue_rp,
             winner=winner,
-            red_fuel_scored=self.red_fuel_scored,
-            blue_fuel_scored=self.blue_fuel_scored,
-            red_tower_points=self.red_tower_points,
-            blue_tower_points=self.blue_tower_points,
-            red_penalties_drawn=self.red_penalty_points,
-            blue_penalties_drawn=self.blue_penalty_points,
+            red_fuel_scored=red_fuel,
+            blue_fuel_scored=blue_fuel,
+            red_tower_points=red_tower,
+            blue_tower_points=blue_tower,
+            red_penalties_drawn=red_penalty_pts,
+            blue_penalties_drawn=blue_penalty_pts,
             red_energized=red_energized,
             red_supercharged=red_supercharged,
             red_traversal=red_traversal,
             blue_energized=blue_energized,
             blue_supercharged=blue_supercharged,
             blue_traversal=blue_traversal,
-            phase_scores=self.phase_scores,
+            phase_scores={
+                phase.value: {"red": red, "blue": blue}
+                for phase, (red, blue) in zip(_PHASES, self._phase_points)
+            },
         )
 
     # ------------------------------------------------------------------
@@ -679,7 +734,7 @@ class MatchEngine:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _distribute_preload(robots: List[Robot], total_preload: int) -> None:
+    def _distribute_preload(robots: Sequence[Robot], total_preload: int) -> None:
         """Distribute preloaded fuel across alliance robots.
 
         Each robot gets up to its auto_fuel_target, capped at AUTO_PRELOAD_MAX (8).
@@ -699,3 +754,9 @@ class MatchEngine:
             fuel = min(target, remaining)
             robot.state.fuel_held = fuel
             remaining -= fuel
+
+
+def _run_spec(spec: Tuple[AllianceConfig, AllianceConfig, int]) -> SimulationResult:
+    """Run one (red, blue, seed) match; module-level so worker processes can pickle it."""
+    red_alliance, blue_alliance, seed = spec
+    return MatchEngine(red_alliance, blue_alliance, seed=seed).run()
@@ -9,7 +9,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple, Type, TypeVar
+
+E = TypeVar("E", bound=Enum)
 
 
 # ---------------------------------------------------------------------------
@@ -205,11 +207,24 @@ class PhaseActionType(str, Enum):
     HP_FED_SCORING = "hp_fed_scoring"
 
 
+def parse_enum(enum_cls: Type[E], value) -> E:
+    """Return the member of *enum_cls* whose value is *value*.
+
+    Looks the value up in the class's value-to-member map directly, which
+    skips the ``EnumType.__call__`` machinery; unknown values fall through
+    to the normal constructor so callers still get its ``ValueError``.
+    """
+    member = enum_cls._value2member_map_.get(value)
+    if member is None:
+        return enum_cls(value)
+    return member
+
+
 # ---------------------------------------------------------------------------
 # Dataclasses
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class MatchState:
     """Central match state, owned by the Match Engine (Agent 1)."""
 
@@ -227,7 +242,7 @@ class MatchState:
     blue_penalties: int = 0       # penalty points awarded TO red FROM blue fouls
 
 
-@dataclass
+@dataclass(slots=True)
 class RobotState:
     """Per-robot state tracked every tick, owned by Robot Behavior (Agent 2)."""
 
@@ -252,7 +267,7 @@ class RobotState:
     fouls_drawn_this_match: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class RobotConfig:
     """Static robot configuration set before match start (Agent 4 -> Agent 2)."""
 
@@ -296,7 +311,7 @@ class RobotConfig:
     preposition_before_shift: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class RobotRuntimeState:
     """Tracks mid-match mechanism degradation and failures."""
 
@@ -308,21 +323,37 @@ class RobotRuntimeState:
     fuel_pushed_to_zone: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldState:
     """Global field state, owned by the Field State Manager (Agent 3)."""
 
     neutral_fuel_available: int = 20
-    red_outpost_fuel: int = 10
-    blue_outpost_fuel: int = 10
+    outpost_fuel: List[int] = field(default_factory=lambda: [10, 10])  # [red, blue]
     fuel_in_flight: int = 0
     fuel_in_transit: int = 0
-    transit_queue: List[Tuple[float, int]] = field(default_factory=list)
-    red_tower_occupants: List[str] = field(default_factory=list)
-    blue_tower_occupants: List[str] = field(default_factory=list)
+    transit_buckets: List[int] = field(default_factory=list)  # ring buffer: tick % len -> count
+    transit_tick: int = -1                                     # last tick drained from the ring
+    tower_occupants: List[List[str]] = field(default_factory=lambda: [[], []])  # [red, blue]
     congestion_red_hub: float = 0.0                    # 0.0 - 1.0
     congestion_blue_hub: float = 0.0                   # 0.0 - 1.0
 
+    # Read-only per-alliance views of the [red, blue] lists.
+    @property
+    def red_outpost_fuel(self) -> int:
+        return self.outpost_fuel[0]
+
+    @property
+    def blue_outpost_fuel(self) -> int:
+        return self.outpost_fuel[1]
+
+    @property
+    def red_tower_occupants(self) -> List[str]:
+        return self.tower_occupants[0]
+
+    @property
+    def blue_tower_occupants(self) -> List[str]:
+        return self.tower_occupants[1]
+
     def total_fuel_check(self, robots: List[RobotState]) -> int:
         """Conservation invariant -- must always equal TOTAL_FUEL (60).
 
@@ -336,33 +367,40 @@ class FieldState:
         int
             The total fuel accounted for across all states.
         """
-        fuel_in_robots = sum(r.fuel_held + r.fuel_being_pushed for r in robots)
+        # Plain loop: for six robots it beats sum() over a generator, which
+        # pays a frame resume per item.
+        fuel_in_robots = 0
+        for r in robots:
+            fuel_in_robots += r.fuel_held + r.fuel_being_pushed
         return (
             self.neutral_fuel_available
-            + self.red_outpost_fuel
-            + self.blue_outpost_fuel
+            + self.outpost_fuel[0]
+            + self.outpost_fuel[1]
             + self.fuel_in_flight
             + self.fuel_in_transit
             + fuel_in_robots
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AllianceConfig:
     """Alliance-level configuration (Agent 4 -> Agent 1, Agent 2)."""
 
     robots: List[RobotConfig] = field(default_factory=list)
     strategy_preset: StrategyPreset = StrategyPreset.FULL_OFFENSE
     human_player_mode: HumanPlayerMode = HumanPlayerMode.MIXED
-    endgame_plan: List[int] = field(default_factory=lambda: [3, 2, 1])
-    auto_plan: List[AutoAction] = field(
-        default_factory=lambda: [AutoAction.SCORE_FUEL] * 3
-    )
+    # Per-robot plans are replaced wholesale, never edited in place, so the
+    # defaults are shared immutable tuples rather than per-instance lists.
+    endgame_plan: Tuple[int, ...] = (3, 2, 1)
+    auto_plan: Tuple[AutoAction, ...] = (AutoAction.SCORE_FUEL,) * 3
+
 
+class PhaseAction(NamedTuple):
+    """Snapshot of what a robot is doing at a given moment, driven by shift state.
 
-@dataclass
-class PhaseAction:
-    """Snapshot of what a robot is doing at a given moment, driven by shift state."""
+    A NamedTuple rather than a dataclass: snapshots are immutable, and the
+    tuple layout gives C-level construction, equality and hashing.
+    """
 
     phase: Phase = Phase.AUTO
     hub_active: bool = True
@@ -372,7 +410,7 @@ class PhaseAction:
     time_in_action: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationResult:
     """Final output of a single simulated match (Agent 5)."""
 
@@ -9,7 +9,9 @@ autonomous routines, and shift-change role transitions.
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING, Dict, Optional
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Tuple
 
 from .models import (
     Alliance,
@@ -34,7 +36,6 @@ from .models import (
     TurretStatus,
 )
 from .config import (
-    ARCHETYPE_DEFAULTS,
     AUTO_L1_CLIMB_TIME,
     AUTO_L1_DESCEND_TIME,
     CROSSFIELD_DRIVE_TIME,
@@ -50,8 +51,9 @@ from .config import (
     FOUL_RATE_NEUTRAL_ZONE,
     FOUL_RATE_NEAR_TOWER,
     FOUL_RATE_OPPONENT_ALLIANCE,
-    INDEXER_JAM_RATES,
-    INDEXER_RATES,
+    INDEXER_JAM_TABLE,
+    INDEXER_RATE_TABLE,
+    Indexer,
     INTAKE_BREAK_RATE_SIMPLE,
     INTAKE_DEGRADE_RATE_SIMPLE,
     INTAKE_JAM_CLEAR_TIME,
@@ -79,6 +81,7 @@ from .config import (
     TURRET_ALIGN_TIME,
     TURRET_FAILURE_RATE,
 )
+from .archetypes import ArchetypeSpec, get_archetype
 
 if TYPE_CHECKING:
     pass  # field_manager type would go here
@@ -87,55 +90,100 @@ if TYPE_CHECKING:
 # ---------------------------------------------------------------------------
 # Intake quality parameters: (success_rate_range, time_per_fuel_range)
 # ---------------------------------------------------------------------------
-_INTAKE_QUALITY_PARAMS: Dict[str, Dict[str, tuple]] = {
-    IntakeQuality.TOUCH_AND_GO.value: {
+_INTAKE_QUALITY_PARAMS: Dict[IntakeQuality, Dict[str, tuple]] = {
+    IntakeQuality.TOUCH_AND_GO: {
         "success_range": (0.95, 0.99),
         "time_range": (0.2, 0.4),
     },
-    IntakeQuality.SLOW_PICKUP.value: {
+    IntakeQuality.SLOW_PICKUP: {
         "success_range": (0.80, 0.90),
         "time_range": (0.5, 1.0),
     },
-    IntakeQuality.PUSH_AROUND.value: {
+    IntakeQuality.PUSH_AROUND: {
         "success_range": (0.50, 0.70),
         "time_range": (1.0, 3.0),
     },
-    IntakeQuality.NO_GROUND_PICKUP.value: {
+    IntakeQuality.NO_GROUND_PICKUP: {
         "success_range": (0.0, 0.0),
         "time_range": (0.0, 0.0),
     },
 }
 
 
+# Base climb duration (seconds) by target level, jittered +/-20% per attempt.
+_CLIMB_BASE_TIME: Dict[int, float] = {1: 3.0, 2: 5.0, 3: 7.0}
+
+# Read-only defense effect tables returned by Robot.get_defense_effects().
+_NO_DEFENSE_EFFECTS: Mapping[str, float] = MappingProxyType(
+    {"cycle_hit": 0.0, "accuracy_hit": 0.0}
+)
+_DEFENSE_EFFECTS: Mapping[str, float] = MappingProxyType({
+    "cycle_hit_turret": DEFENSE_CYCLE_HIT_TURRET,
+    "cycle_hit_fixed": DEFENSE_CYCLE_HIT_FIXED,
+    "accuracy_hit_turret": DEFENSE_ACCURACY_HIT_TURRET,
+    "accuracy_hit_fixed": DEFENSE_ACCURACY_HIT_FIXED,
+})
+
+
+# Enum members read by the per-tick dispatch, bound once as module globals.
+# Attribute access on an Enum class goes through EnumType's Python-level
+# __getattr__ hook and costs several times a plain global load.  State fields
+# only ever hold these members, so the dispatch tests identity with ``is``.
+_AUTO, _TRANSITION, _ENDGAME = Phase.AUTO, Phase.TRANSITION, Phase.ENDGAME
+_SCORER, _STOCKPILER, _DEFENDER, _PUSHER = (
+    ShiftRole.SCORER, ShiftRole.STOCKPILER, ShiftRole.DEFENDER, ShiftRole.PUSHER,
+)
+_IDLE = RobotAction.IDLE
+_NO_SHOOTER = ShooterType.NONE
+
+
+# Fuel-per-second by shooter type.
+_SHOOT_RATE_BY_TYPE: Dict[ShooterType, float] = {
+    ShooterType.SINGLE_TURRET: SHOOT_RATE_SINGLE,
+    ShooterType.SINGLE_FIXED: SHOOT_RATE_SINGLE,
+    ShooterType.DOUBLE_FIXED: SHOOT_RATE_DOUBLE,
+    ShooterType.TRIPLE_FIXED: SHOOT_RATE_TRIPLE,
+    ShooterType.DUMPER: SHOOT_RATE_DUMPER,
+    ShooterType.NONE: 0.0,
+}
+
+# Alignment time by (shooter type, turret status).  Turret robots skip
+# alignment unless the turret is stuck; dumpers have zero align time (must
+# already be at hub); all fixed variants need FIXED_ALIGN_TIME.
+_ALIGN_TIME_BY_SHOOTER: Dict[Tuple[ShooterType, TurretStatus], float] = {
+    (shooter, turret): FIXED_ALIGN_TIME
+    for shooter in ShooterType
+    for turret in TurretStatus
+}
+_ALIGN_TIME_BY_SHOOTER.update({
+    (ShooterType.SINGLE_TURRET, TurretStatus.NOMINAL): TURRET_ALIGN_TIME,
+    (ShooterType.DUMPER, TurretStatus.NOMINAL): 0.0,
+    (ShooterType.DUMPER, TurretStatus.STUCK): 0.0,
+})
+
+# Shared ArchetypeSpec per Archetype.  Enum values and ARCHETYPE_DEFAULTS
+# keys may differ (e.g. Archetype.STRONG="strong" -> key "strong_scorer",
+# Archetype.DEFENSE="defense" -> key "defense_bot").
+_ARCH_KEY_MAP: Dict[str, str] = {
+    "strong": "strong_scorer",
+    "defense": "defense_bot",
+}
+_ARCHETYPE_SPECS: Dict[Archetype, ArchetypeSpec] = {
+    archetype: get_archetype(_ARCH_KEY_MAP.get(archetype.value, archetype.value))
+    for archetype in Archetype
+}
+
+
 def _shoot_rate_for_type(shooter_type: ShooterType) -> float:
     """Return fuel-per-second for the given shooter type."""
-    return {
-        ShooterType.SINGLE_TURRET: SHOOT_RATE_SINGLE,
-        ShooterType.SINGLE_FIXED: SHOOT_RATE_SINGLE,
-        ShooterType.DOUBLE_FIXED: SHOOT_RATE_DOUBLE,
-        ShooterType.TRIPLE_FIXED: SHOOT_RATE_TRIPLE,
-        ShooterType.DUMPER: SHOOT_RATE_DUMPER,
-        ShooterType.NONE: 0.0,
-    }.get(shooter_type, SHOOT_RATE_SINGLE)
+    return _SHOOT_RATE_BY_TYPE.get(shooter_type, SHOOT_RATE_SINGLE)
 
 
 def _align_time_for_shooter(
     shooter_type: ShooterType, turret_status: TurretStatus
 ) -> float:
-    """Return alignment time in seconds.
-
-    Turret robots skip alignment unless the turret is stuck.
-    Dumper robots have zero align time (must already be at hub).
-    Fixed-shooter robots require FIXED_ALIGN_TIME.
-    """
-    if shooter_type == ShooterType.SINGLE_TURRET:
-        if turret_status == TurretStatus.STUCK:
-            return FIXED_ALIGN_TIME
-        return TURRET_ALIGN_TIME
-    if shooter_type == ShooterType.DUMPER:
-        return 0.0
-    # All fixed variants
-    return FIXED_ALIGN_TIME
+    """Return alignment time in seconds (see ``_ALIGN_TIME_BY_SHOOTER``)."""
+    return _ALIGN_TIME_BY_SHOOTER.get((shooter_type, turret_status), FIXED_ALIGN_TIME)
 
 
 def _jam_rate_for_hopper(hopper_type: HopperType) -> float:
@@ -157,6 +205,20 @@ class Robot:
     when intaking fuel from the field.
     """
 
+    __slots__ = (
+        "robot_id", "alliance", "config", "rng", "_arch", "state", "runtime",
+        "_cycle_time_mean", "_cycle_time_stddev", "_accuracy",
+        "_shoot_rate", "_shots_per_tick", "_intake_rate",
+        "_indexer_jam_rate", "_effective_shooter", "_intake_quality",
+        "_failures_checked",
+        "_auto_fuel_scored", "_auto_cycles_completed",
+        "_auto_climb_attempted", "_auto_climb_scored",
+        "_auto_shooting_started", "_auto_descending",
+        "_stockpile_ready", "_cycle_phase", "_cycle_total_time",
+        "_defense_foul_checked_this_shift", "_current_shift_phase",
+        "_climb_attempted_teleop",
+    )
+
     # ------------------------------------------------------------------
     # Construction
     # ------------------------------------------------------------------
@@ -174,19 +236,7 @@ class Robot:
         self.rng = rng
 
         # Archetype defaults for convenience.
-        # Map Archetype enum values to ARCHETYPE_DEFAULTS keys, which may
-        # differ (e.g. Archetype.STRONG="strong" -> key "strong_scorer",
-        # Archetype.DEFENSE="defense" -> key "defense_bot").
-        _ARCH_KEY_MAP = {
-            "strong": "strong_scorer",
-            "defense": "defense_bot",
-        }
-        arch_key = config.archetype.value
-        mapped_key = _ARCH_KEY_MAP.get(arch_key, arch_key)
-        self._arch: Dict = ARCHETYPE_DEFAULTS.get(
-            mapped_key,
-            ARCHETYPE_DEFAULTS.get(arch_key, {}),
-        )
+        self._arch: ArchetypeSpec = _ARCHETYPE_SPECS[config.archetype]
 
         # Build RobotState
         self.state = RobotState(
@@ -208,12 +258,17 @@ class Robot:
         self.runtime = RobotRuntimeState()
 
         # Internal bookkeeping
-        self._cycle_time_mean: float = self._arch.get("cycle_time_mean", 18.0)
-        self._cycle_time_stddev: float = self._arch.get("cycle_time_stddev", 2.7)
-        self._accuracy: float = self._arch.get("accuracy", 0.50)
+        self._cycle_time_mean: float = self._arch.cycle_time_mean
+        self._cycle_time_stddev: float = self._arch.cycle_time_stddev
+        self._accuracy: float = self._arch.accuracy
+        # Indexer throughput and jam rate, resolved once from the enum tables
+        indexer = Indexer[config.indexer_type.name]
+        indexer_rate = INDEXER_RATE_TABLE[indexer]
+        self._indexer_jam_rate: float = INDEXER_JAM_TABLE[indexer]
         # Shoot rate: min of config shoot_rate and indexer throughput (bottleneck)
-        indexer_rate = INDEXER_RATES.get(config.indexer_type.value, 6.0)
-        self._shoot_rate: float = min(config.shoot_rate, indexer_rate) if config.shoot_rate > 0 else _shoot_rate_for_type(config.shooter_type)
+        self._set_shoot_rate(
+            min(config.shoot_rate, indexer_rate) if config.shoot_rate > 0 else _shoot_rate_for_type(config.shooter_type)
+        )
         self._intake_rate: float = config.intake_rate
         self._effective_shooter: ShooterType = config.shooter_type
         self._intake_quality: IntakeQuality = config.intake_quality
@@ -266,17 +321,30 @@ class Robot:
             self.check_failures()
             self._failures_checked = True
 
-        # Detect shift change -> call on_shift_change
-        self._detect_shift_change(match_state)
-
         phase = match_state.current_phase
 
+        # Detect shift change -> call on_shift_change.  The engine reads the
+        # phase from its per-tick table, so an identity test suffices here.
+        if phase is not self._current_shift_phase:
+            self._detect_shift_change(match_state)
+
+        # Mid-countdown fast path.  In auto and every teleop role the handler
+        # first counts down action_timer and returns while it is still
+        # running, so a robot that will not finish this tick skips dispatch.
+        # Transition and endgame do other work first and always dispatch.
+        if phase is not _TRANSITION and phase is not _ENDGAME:
+            state = self.state
+            remaining = state.action_timer - dt
+            if remaining > 0:
+                state.action_timer = remaining
+                return
+
         # Phase-specific top-level behavior
-        if phase == Phase.AUTO:
+        if phase is _AUTO:
             self._tick_auto(match_state, field_manager, dt)
-        elif phase == Phase.TRANSITION:
+        elif phase is _TRANSITION:
             self._tick_transition(match_state, dt)
-        elif phase == Phase.ENDGAME:
+        elif phase is _ENDGAME:
             self._tick_endgame(match_state, field_manager, dt)
         else:
             # Teleop shifts 1-4
@@ -326,7 +394,7 @@ class Robot:
         self._stockpile_ready = False
         self._cycle_phase = "dumping"
 
-    def get_defense_effects(self) -> Dict[str, float]:
+    def get_defense_effects(self) -> Mapping[str, float]:
         """Return the defense disruption this robot inflicts on its target.
 
         Returns a dict with ``cycle_hit`` (fractional increase to cycle time)
@@ -337,17 +405,12 @@ class Robot:
         robot and applying these effects.
         """
         if not self.state.is_defending:
-            return {"cycle_hit": 0.0, "accuracy_hit": 0.0}
+            return _NO_DEFENSE_EFFECTS
 
         # Determine target's shooter type from defense_target config.
         # We return generic values keyed by fixed vs turret -- the match engine
         # resolves the actual target shooter type.
-        return {
-            "cycle_hit_turret": DEFENSE_CYCLE_HIT_TURRET,
-            "cycle_hit_fixed": DEFENSE_CYCLE_HIT_FIXED,
-            "accuracy_hit_turret": DEFENSE_ACCURACY_HIT_TURRET,
-            "accuracy_hit_fixed": DEFENSE_ACCURACY_HIT_FIXED,
-        }
+        return _DEFENSE_EFFECTS
 
     # ------------------------------------------------------------------
     # Shift change helpers
@@ -453,9 +516,11 @@ class Robot:
         - DISRUPT_NEUTRAL: drive to neutral zone and scatter fuel
         """
         # If we're still counting down an action, decrement and maybe complete
-        if self.state.action_timer > 0:
-            self.state.action_timer -= dt
-            if self.state.action_timer <= 0:
+        timer = self.state.action_timer
+        if timer > 0:
+            timer -= dt
+            self.state.action_timer = timer
+            if timer <= 0:
                 self._complete_auto_action(match_state, field_manager)
             return
 
@@ -535,7 +600,7 @@ class Robot:
                 self.alliance, RobotZone.NEUTRAL, PUSH_FUEL_PER_TRIP
             )
             scattered = int(round(pushed * PUSH_SCATTER_RATE))
-            net = max(0, pushed - scattered)
+            net = pushed - scattered if pushed > scattered else 0
             if net > 0 and hasattr(field_manager, "add_fuel_to_alliance_zone"):
                 field_manager.add_fuel_to_alliance_zone(self.alliance, net)
             if scattered > 0 and hasattr(field_manager, "return_fuel_to_field"):
@@ -558,7 +623,9 @@ class Robot:
             self._effective_shooter, self.runtime.turret_status
         )
         # Time to shoot all held fuel
-        rate = max(self._shoot_rate, 0.1)
+        rate = self._shoot_rate
+        if rate < 0.1:
+            rate = 0.1
         shoot_time = self.state.fuel_held / rate
         self.state.current_action = RobotAction.SHOOTING
         self.state.action_timer = align + shoot_time
@@ -568,82 +635,85 @@ class Robot:
         self, match_state: MatchState, field_manager
     ) -> None:
         """Handle completion of an auto action."""
-        if self._cycle_phase == "auto_drive":
+        state = self.state
+        phase = self._cycle_phase
+
+        if phase == "auto_drive":
             # At hub, now shoot
             self._start_auto_shot_burst()
 
-        elif self._cycle_phase == "auto_shoot":
+        elif phase == "auto_shoot":
             # All fuel shot -- match engine resolves accuracy per tick
             # Mark fuel as expended (match engine handles scoring)
-            self._auto_fuel_scored += self.state.fuel_held
-            self.state.fuel_held = 0
+            self._auto_fuel_scored += state.fuel_held
+            state.fuel_held = 0
             self._auto_cycles_completed += 1
             self._auto_shooting_started = False  # Allow another cycle
-            self.state.action_timer = 0.0
-            self.state.current_action = RobotAction.IDLE
+            state.action_timer = 0.0
+            state.current_action = RobotAction.IDLE
             self._cycle_phase = "idle"
 
-        elif self._cycle_phase == "auto_drive_to_neutral":
+        elif phase == "auto_drive_to_neutral":
             # At neutral, intake fuel
-            fuel_needed = self.state.storage_capacity - self.state.fuel_held
+            fuel_needed = state.storage_capacity - state.fuel_held
             if fuel_needed > 0:
                 got = field_manager.try_intake(
                     self.alliance, RobotZone.NEUTRAL, fuel_needed
                 )
-                self.state.fuel_held += got
+                state.fuel_held += got
             # Intake time based on intake_rate
-            if self._intake_rate > 0 and self.state.fuel_held > 0:
-                intake_time = self.state.fuel_held / self._intake_rate
+            if self._intake_rate > 0 and state.fuel_held > 0:
+                intake_time = state.fuel_held / self._intake_rate
             else:
                 intake_time = 0.5
-            self.state.current_action = RobotAction.INTAKING
-            self.state.action_timer = intake_time
+            state.current_action = RobotAction.INTAKING
+            state.action_timer = intake_time
             self._cycle_phase = "auto_intake"
 
-        elif self._cycle_phase == "auto_intake":
+        elif phase == "auto_intake":
             # Done intaking, drive back to hub
-            self.state.current_action = RobotAction.DRIVING
-            self.state.position = RobotZone.HUB
-            self.state.action_timer = self.rng.uniform(1.5, 2.5)
+            state.current_action = RobotAction.DRIVING
+            state.position = RobotZone.HUB
+            state.action_timer = self.rng.uniform(1.5, 2.5)
             self._cycle_phase = "auto_drive"
 
-        elif self._cycle_phase == "auto_climb_drive":
+        elif phase == "auto_climb_drive":
             # At tower, start climbing
-            self.state.current_action = RobotAction.CLIMBING
-            self.state.is_climbing = True
-            self.state.action_timer = AUTO_L1_CLIMB_TIME
+            state.current_action = RobotAction.CLIMBING
+            state.is_climbing = True
+            state.action_timer = AUTO_L1_CLIMB_TIME
             self._cycle_phase = "auto_climb"
 
-        elif self._cycle_phase == "auto_climb":
+        elif phase == "auto_climb":
             # Resolve climb attempt
-            success_rate = self._arch.get("climb_success_L1", 0.0)
+            success_rate = self._arch.climb_success_L1
             if self.rng.random() < success_rate:
-                self.state.climb_level = 1
+                state.climb_level = 1
                 self._auto_climb_scored = True
-            self.state.is_climbing = False
+            state.is_climbing = False
             # Now descend
             self._auto_descending = True
-            self.state.current_action = RobotAction.DRIVING
-            self.state.position = RobotZone.TOWER
-            self.state.action_timer = AUTO_L1_DESCEND_TIME
+            state.current_action = RobotAction.DRIVING
+            state.position = RobotZone.TOWER
+            state.action_timer = AUTO_L1_DESCEND_TIME
             self._cycle_phase = "auto_descend"
 
-        elif self._cycle_phase == "auto_descend":
+        elif phase == "auto_descend":
             # Back on field
             self._auto_descending = False
-            self.state.position = RobotZone.ALLIANCE
-            self.state.current_action = RobotAction.IDLE
+            state.position = RobotZone.ALLIANCE
+            state.current_action = RobotAction.IDLE
             self._cycle_phase = "idle"
 
-        elif self._cycle_phase == "auto_disrupt_drive":
+        elif phase == "auto_disrupt_drive":
             # At neutral, start disrupting
-            self.state.current_action = RobotAction.PUSHING_FUEL
-            self.state.position = RobotZone.NEUTRAL
-            self.state.is_pushing_fuel = True
-            self.state.action_timer = TICK_INTERVAL
+            state.current_action = RobotAction.PUSHING_FUEL
+            state.position = RobotZone.NEUTRAL
+            state.is_pushing_fuel = True
+            state.action_timer = TICK_INTERVAL
             self._cycle_phase = "auto_disrupting"
 
-        elif self._cycle_phase == "auto_disrupting":
+        elif phase == "auto_disrupting":
             # Continue disrupting
             self._tick_auto_disrupt(match_state, field_manager)
 
@@ -666,13 +736,13 @@ class Robot:
         """
         role = self.state.shift_role
 
-        if role == ShiftRole.SCORER:
+        if role is _SCORER:
             self._tick_scoring(match_state, field_manager, dt)
-        elif role == ShiftRole.STOCKPILER:
+        elif role is _STOCKPILER:
             self._tick_stockpiling(match_state, field_manager, dt)
-        elif role == ShiftRole.DEFENDER:
+        elif role is _DEFENDER:
             self._tick_defending(match_state, dt)
-        elif role == ShiftRole.PUSHER:
+        elif role is _PUSHER:
             self._tick_pushing(match_state, field_manager, dt)
 
     def _tick_endgame(
@@ -684,10 +754,13 @@ class Robot:
         climb_start_time = 0 means never climb (score only).
         """
         # If climbing, count down
-        if self.state.is_climbing:
-            if self.state.action_timer > 0:
-                self.state.action_timer -= dt
-                if self.state.action_timer <= 0:
+        state = self.state
+        if state.is_climbing:
+            timer = state.action_timer
+            if timer > 0:
+                timer -= dt
+                state.action_timer = timer
+                if timer <= 0:
                     self._resolve_climb()
             return
 
@@ -715,10 +788,10 @@ class Robot:
     def _start_scoring_cycle(self) -> None:
         """Begin a new scoring cycle: drive to fuel -> intake -> drive to hub -> align -> shoot."""
         # Generate cycle time from normal distribution
-        cycle_time = max(
-            self._cycle_time_mean * 0.5,
-            self.rng.gauss(self._cycle_time_mean, self._cycle_time_stddev),
-        )
+        cycle_time = self.rng.gauss(self._cycle_time_mean, self._cycle_time_stddev)
+        floor = self._cycle_time_mean * 0.5
+        if cycle_time < floor:
+            cycle_time = floor
 
         # Break cycle into phases (approximate proportions from spec)
         # Drive to fuel: ~25%, Intake: ~20%, Drive to hub: ~20%, Align: ~15%, Shoot: ~20%
@@ -738,19 +811,21 @@ class Robot:
     ) -> None:
         """Progress through the scoring cycle state machine."""
         # Count down current action timer
-        if self.state.action_timer > 0:
-            self.state.action_timer -= dt
-            if self.state.action_timer > 0:
+        timer = self.state.action_timer
+        if timer > 0:
+            timer -= dt
+            self.state.action_timer = timer
+            if timer > 0:
                 return
             # Action completed -- transition
             self._on_scoring_action_complete(match_state, field_manager)
             return
 
         # No action running -- start a new cycle
-        if self.state.current_action == RobotAction.IDLE:
-            if self._effective_shooter == ShooterType.NONE:
+        if self.state.current_action is _IDLE:
+            if self._effective_shooter == _NO_SHOOTER:
                 # Defense bot or broken shooter can't score
-                self.state.current_action = RobotAction.IDLE
+                self.state.current_action = _IDLE
                 return
             self._start_scoring_cycle()
 
@@ -791,7 +866,7 @@ class Robot:
             self._cycle_phase = "drive_to_outpost"
             return
 
-        params = _INTAKE_QUALITY_PARAMS[quality.value]
+        params = _INTAKE_QUALITY_PARAMS[quality]
         success_lo, success_hi = params["success_range"]
 
         # Determine how many fuel to attempt to pick up (fill to capacity)
@@ -810,7 +885,8 @@ class Robot:
 
             # Apply degradation
             if self.runtime.intake_status == MechanismStatus.DEGRADED:
-                success_rate = min(success_rate, DEGRADED_INTAKE_SUCCESS_RATE)
+                if success_rate > DEGRADED_INTAKE_SUCCESS_RATE:
+                    success_rate = DEGRADED_INTAKE_SUCCESS_RATE
 
             if self.rng.random() < success_rate:
                 # Try to get fuel from field
@@ -872,8 +948,7 @@ class Robot:
             return
 
         # Check for jam -- use indexer jam rate (primary bottleneck)
-        indexer_jam = INDEXER_JAM_RATES.get(self.config.indexer_type.value, 0.01)
-        if self.rng.random() < indexer_jam:
+        if self.rng.random() < self._indexer_jam_rate:
             # Jam! Spend time clearing
             self.state.current_action = RobotAction.CLEARING_JAM
             self.state.action_timer = JAM_CLEAR_TIME
@@ -939,14 +1014,16 @@ class Robot:
         self, match_state: MatchState, field_manager, dt: float
     ) -> None:
         """Progress through the stockpiling cycle."""
-        if self.state.action_timer > 0:
-            self.state.action_timer -= dt
-            if self.state.action_timer > 0:
+        timer = self.state.action_timer
+        if timer > 0:
+            timer -= dt
+            self.state.action_timer = timer
+            if timer > 0:
                 return
             self._on_stockpile_action_complete(field_manager)
             return
 
-        if self.state.current_action == RobotAction.IDLE:
+        if self.state.current_action is _IDLE:
             if self._stockpile_ready:
                 # Waiting for shift change, do nothing
                 return
@@ -994,14 +1071,15 @@ class Robot:
             self._cycle_phase = "stockpile_intake"
             return
 
-        params = _INTAKE_QUALITY_PARAMS[quality.value]
+        params = _INTAKE_QUALITY_PARAMS[quality]
         success_lo, success_hi = params["success_range"]
 
         fuel_picked = 0
         for _ in range(fuel_needed):
             success_rate = self.rng.uniform(success_lo, success_hi)
             if self.runtime.intake_status == MechanismStatus.DEGRADED:
-                success_rate = min(success_rate, DEGRADED_INTAKE_SUCCESS_RATE)
+                if success_rate > DEGRADED_INTAKE_SUCCESS_RATE:
+                    success_rate = DEGRADED_INTAKE_SUCCESS_RATE
 
             if self.rng.random() < success_rate:
                 got = field_manager.try_intake(self.alliance, self.state.position, 1)
@@ -1154,13 +1232,15 @@ class Robot:
         self, match_state: MatchState, field_manager, dt: float
     ) -> None:
         """Progress through fuel pushing cycle."""
-        if self.state.action_timer > 0:
-            self.state.action_timer -= dt
-            if self.state.action_timer <= 0:
+        timer = self.state.action_timer
+        if timer > 0:
+            timer -= dt
+            self.state.action_timer = timer
+            if timer <= 0:
                 self._complete_push_trip(field_manager)
             return
 
-        if self.state.current_action == RobotAction.IDLE:
+        if self.state.current_action is _IDLE:
             self._start_push_cycle()
 
     def _complete_push_trip(self, field_manager) -> None:
@@ -1172,7 +1252,7 @@ class Robot:
 
         # Scatter loss
         scattered = int(round(pushed * PUSH_SCATTER_RATE))
-        net_pushed = max(0, pushed - scattered)
+        net_pushed = pushed - scattered if pushed > scattered else 0
 
         # Return scattered fuel to field (field_manager handles this)
         if scattered > 0 and hasattr(field_manager, "return_fuel_to_field"):
@@ -1207,7 +1287,7 @@ class Robot:
         self.state.position = RobotZone.TOWER
 
         # Climb time scales with level
-        base_time = {1: 3.0, 2: 5.0, 3: 7.0}.get(target, 3.0)
+        base_time = _CLIMB_BASE_TIME.get(target, 3.0)
         climb_time = self.rng.uniform(base_time * 0.8, base_time * 1.2)
         self.state.action_timer = climb_time
         self._cycle_phase = "climbing"
@@ -1215,19 +1295,13 @@ class Robot:
     def _resolve_climb(self) -> None:
         """Resolve the climb attempt with a Bernoulli trial."""
         target = self.config.climb_target
-        success_key = f"climb_success_L{target}"
-        success_rate = self._arch.get(success_key, 0.0)
 
-        if self.rng.random() < success_rate:
-            self.state.climb_level = target
-        else:
-            # Failed -- might still get a lower level
-            # Try one level lower as a fallback
-            if target >= 2:
-                fallback_key = f"climb_success_L{target - 1}"
-                fallback_rate = self._arch.get(fallback_key, 0.0)
-                if self.rng.random() < fallback_rate:
-                    self.state.climb_level = target - 1
+        # One uniform draw against the precomputed outcome CDF: a clean climb,
+        # a fallback to one level lower (L2+ only), or a miss.
+        cdf = self._arch.climb_cdf[target]
+        outcome = bisect_right(cdf, self.rng.random())
+        if outcome < len(cdf):
+            self.state.climb_level = target - outcome
 
         self.state.is_climbing = False
         self.state.current_action = RobotAction.IDLE
@@ -1295,9 +1369,9 @@ class Robot:
             self.state.shooter_status = MechanismStatus.DEGRADED
             # Degraded shooter: lose throughput
             if shooter == ShooterType.TRIPLE_FIXED:
-                self._shoot_rate = SHOOT_RATE_DOUBLE  # one barrel down
+                self._set_shoot_rate(SHOOT_RATE_DOUBLE)  # one barrel down
             elif shooter == ShooterType.DOUBLE_FIXED:
-                self._shoot_rate = SHOOT_RATE_SINGLE  # one barrel down
+                self._set_shoot_rate(SHOOT_RATE_SINGLE)  # one barrel down
 
     def _check_turret_failure(self) -> None:
         """Roll for turret getting stuck (turret bots only)."""
@@ -1326,10 +1400,26 @@ class Robot:
         """Return current shooting rate in fuel per second."""
         return self._shoot_rate
 
+    def get_shots_per_tick(self) -> int:
+        """Return how many fuel the match engine resolves per SHOOTING tick.
+
+        Zero when the robot cannot shoot; otherwise at least one.
+        """
+        return self._shots_per_tick
+
+    def _set_shoot_rate(self, rate: float) -> None:
+        """Set the shooting rate and refresh the derived per-tick shot count."""
+        self._shoot_rate = rate
+        self._shots_per_tick = max(1, int(rate * TICK_INTERVAL + 0.5)) if rate > 0 else 0
+
     def get_cycle_time_mean(self) -> float:
         """Return the mean cycle time (seconds), useful for the match engine."""
         return self._cycle_time_mean
 
+    def scored_auto_climb(self) -> bool:
+        """Return True if the robot's L1 climb was scored during auto."""
+        return self._auto_climb_scored
+
     def is_turret(self) -> bool:
         """Return True if the robot's effective shooter is a turret."""
         return (
@@ -1368,9 +1458,9 @@ class Robot:
 
         Restores cycle time and accuracy to archetype defaults.
         """
-        self._cycle_time_mean = self._arch.get("cycle_time_mean", 18.0)
-        self._cycle_time_stddev = self._arch.get("cycle_time_stddev", 2.7)
-        self._accuracy = self._arch.get("accuracy", 0.50)
+        self._cycle_time_mean = self._arch.cycle_time_mean
+        self._cycle_time_stddev = self._arch.cycle_time_stddev
+        self._accuracy = self._arch.accuracy
 
         # Re-apply turret stuck penalty if applicable
         if self.runtime.turret_status == TurretStatus.STUCK:
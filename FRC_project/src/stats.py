@@ -10,15 +10,24 @@ Provides:
 from __future__ import annotations
 
 import json
-import statistics
-from typing import Any, Dict, List
+from operator import attrgetter
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 from src.models import AllianceConfig, SimulationResult
 from src.match_engine import MatchEngine
 
 
 class MonteCarloRunner:
-    """Runs multiple match simulations and collects statistics."""
+    """Runs multiple match simulations and collects statistics.
+
+    Seeds ``base_seed .. base_seed + num_simulations - 1`` are simulated.
+    With ``workers > 1`` the matches run in worker processes through
+    ``MatchEngine.run_batch``; results come back in seed order, so the
+    statistics are identical to a serial run.  ``workers=None`` uses
+    every CPU.
+    """
 
     def __init__(
         self,
@@ -26,26 +35,59 @@ class MonteCarloRunner:
         blue_alliance: AllianceConfig,
         num_simulations: int = 100,
         base_seed: int = 42,
+        workers: Optional[int] = 1,
     ) -> None:
         self.red_alliance = red_alliance
         self.blue_alliance = blue_alliance
         self.num_simulations = num_simulations
         self.base_seed = base_seed
+        self.workers = workers
 
     def run(self) -> Dict[str, Any]:
         """Run all simulations and return aggregated statistics."""
-        results: List[SimulationResult] = []
+        seeds = range(self.base_seed, self.base_seed + self.num_simulations)
+        results = MatchEngine.run_batch(
+            ((self.red_alliance, self.blue_alliance, seed) for seed in seeds),
+            workers=self.workers,
+        )
+        return compute_statistics(results)
 
-        for i in range(self.num_simulations):
-            engine = MatchEngine(
-                red_alliance=self.red_alliance,
-                blue_alliance=self.blue_alliance,
-                seed=self.base_seed + i,
-            )
-            result = engine.run()
-            results.append(result)
 
-        return compute_statistics(results)
+# SimulationResult fields gathered into one NumPy column each (structure of arrays).
+_INT_COLUMNS = (
+    "red_total_score", "blue_total_score",
+    "red_fuel_scored", "blue_fuel_scored",
+    "red_tower_points", "blue_tower_points",
+    "red_penalties_drawn", "blue_penalties_drawn",
+    "red_rp", "blue_rp",
+)
+_BOOL_COLUMNS = (
+    "red_energized", "red_supercharged", "red_traversal",
+    "blue_energized", "blue_supercharged", "blue_traversal",
+)
+_WINNER_CODES = {"red": 0, "blue": 1, "tie": 2}
+
+# One prebuilt getter per column, so extraction runs map() over the results
+# instead of resuming a generator frame for every value.
+_INT_GETTERS = tuple((name, attrgetter(name)) for name in _INT_COLUMNS)
+_BOOL_GETTERS = tuple((name, attrgetter(name)) for name in _BOOL_COLUMNS)
+_get_winner = attrgetter("winner")
+
+
+def _result_columns(results: List[SimulationResult]) -> Dict[str, np.ndarray]:
+    """Transpose a list of results into per-field NumPy arrays of length n."""
+    n = len(results)
+    columns: Dict[str, np.ndarray] = {}
+    for name, getter in _INT_GETTERS:
+        columns[name] = np.fromiter(map(getter, results), dtype=np.int32, count=n)
+    for name, getter in _BOOL_GETTERS:
+        columns[name] = np.fromiter(map(getter, results), dtype=np.bool_, count=n)
+    columns["winner"] = np.fromiter(
+        map(_WINNER_CODES.__getitem__, map(_get_winner, results)),
+        dtype=np.int8,
+        count=n,
+    )
+    return columns
 
 
 def compute_statistics(results: List[SimulationResult]) -> Dict[str, Any]:
@@ -54,33 +96,23 @@ def compute_statistics(results: List[SimulationResult]) -> Dict[str, Any]:
     if n == 0:
         return {"error": "No simulation results to analyze"}
 
-    # Extract score lists
-    red_scores = [r.red_total_score for r in results]
-    blue_scores = [r.blue_total_score for r in results]
-    red_fuel = [r.red_fuel_scored for r in results]
-    blue_fuel = [r.blue_fuel_scored for r in results]
-    red_tower = [r.red_tower_points for r in results]
-    blue_tower = [r.blue_tower_points for r in results]
-    red_penalties = [r.red_penalties_drawn for r in results]
-    blue_penalties = [r.blue_penalties_drawn for r in results]
-    red_rps = [r.red_rp for r in results]
-    blue_rps = [r.blue_rp for r in results]
+    cols = _result_columns(results)
+    red_scores = cols["red_total_score"]
+    blue_scores = cols["blue_total_score"]
+    red_fuel = cols["red_fuel_scored"]
+    blue_fuel = cols["blue_fuel_scored"]
 
     # Win rates
-    red_wins = sum(1 for r in results if r.winner == "red")
-    blue_wins = sum(1 for r in results if r.winner == "blue")
-    ties = sum(1 for r in results if r.winner == "tie")
+    red_wins, blue_wins, ties = np.bincount(cols["winner"], minlength=3).tolist()
+
+    def _mean(data: np.ndarray) -> float:
+        return float(data.mean())
 
-    # RP bonus rates
-    red_energized_rate = sum(1 for r in results if r.red_energized) / n
-    red_supercharged_rate = sum(1 for r in results if r.red_supercharged) / n
-    red_traversal_rate = sum(1 for r in results if r.red_traversal) / n
-    blue_energized_rate = sum(1 for r in results if r.blue_energized) / n
-    blue_supercharged_rate = sum(1 for r in results if r.blue_supercharged) / n
-    blue_traversal_rate = sum(1 for r in results if r.blue_traversal) / n
+    def _rate(flags: np.ndarray) -> float:
+        return float(flags.mean()) * 100
 
-    def _safe_stdev(data: List[float]) -> float:
-        return statistics.stdev(data) if len(data) >= 2 else 0.0
+    def _safe_stdev(data: np.ndarray) -> float:
+        return float(data.std(ddof=1)) if data.size >= 2 else 0.0
 
     return {
         "num_simulations": n,
@@ -89,53 +121,53 @@ def compute_statistics(results: List[SimulationResult]) -> Dict[str, Any]:
         "blue_win_pct": blue_wins / n * 100,
         "tie_pct": ties / n * 100,
         # Scores
-        "red_avg_score": statistics.mean(red_scores),
-        "blue_avg_score": statistics.mean(blue_scores),
+        "red_avg_score": _mean(red_scores),
+        "blue_avg_score": _mean(blue_scores),
         "red_score_stdev": _safe_stdev(red_scores),
         "blue_score_stdev": _safe_stdev(blue_scores),
-        "red_score_min": min(red_scores),
-        "red_score_max": max(red_scores),
-        "blue_score_min": min(blue_scores),
-        "blue_score_max": max(blue_scores),
+        "red_score_min": int(red_scores.min()),
+        "red_score_max": int(red_scores.max()),
+        "blue_score_min": int(blue_scores.min()),
+        "blue_score_max": int(blue_scores.max()),
         # Fuel
-        "red_fuel_avg": statistics.mean(red_fuel),
-        "blue_fuel_avg": statistics.mean(blue_fuel),
-        "red_fuel_min": min(red_fuel),
-        "red_fuel_max": max(red_fuel),
-        "blue_fuel_min": min(blue_fuel),
-        "blue_fuel_max": max(blue_fuel),
+        "red_fuel_avg": _mean(red_fuel),
+        "blue_fuel_avg": _mean(blue_fuel),
+        "red_fuel_min": int(red_fuel.min()),
+        "red_fuel_max": int(red_fuel.max()),
+        "blue_fuel_min": int(blue_fuel.min()),
+        "blue_fuel_max": int(blue_fuel.max()),
         # Tower
-        "red_tower_avg": statistics.mean(red_tower),
-        "blue_tower_avg": statistics.mean(blue_tower),
+        "red_tower_avg": _mean(cols["red_tower_points"]),
+        "blue_tower_avg": _mean(cols["blue_tower_points"]),
         # Penalties
-        "red_penalty_avg": statistics.mean(red_penalties),
-        "blue_penalty_avg": statistics.mean(blue_penalties),
+        "red_penalty_avg": _mean(cols["red_penalties_drawn"]),
+        "blue_penalty_avg": _mean(cols["blue_penalties_drawn"]),
         # RPs
-        "red_rp_avg": statistics.mean(red_rps),
-        "blue_rp_avg": statistics.mean(blue_rps),
+        "red_rp_avg": _mean(cols["red_rp"]),
+        "blue_rp_avg": _mean(cols["blue_rp"]),
         # RP bonus rates
-        "red_energized_rate": red_energized_rate * 100,
-        "red_supercharged_rate": red_supercharged_rate * 100,
-        "red_traversal_rate": red_traversal_rate * 100,
-        "blue_energized_rate": blue_energized_rate * 100,
-        "blue_supercharged_rate": blue_supercharged_rate * 100,
-        "blue_traversal_rate": blue_traversal_rate * 100,
+        "red_energized_rate": _rate(cols["red_energized"]),
+        "red_supercharged_rate": _rate(cols["red_supercharged"]),
+        "red_traversal_rate": _rate(cols["red_traversal"]),
+        "blue_energized_rate": _rate(cols["blue_energized"]),
+        "blue_supercharged_rate": _rate(cols["blue_supercharged"]),
+        "blue_traversal_rate": _rate(cols["blue_traversal"]),
         # Score distribution (histogram)
         "red_score_histogram": _histogram(red_scores),
         "blue_score_histogram": _histogram(blue_scores),
     }
 
 
-def _histogram(scores: List[int], bucket_size: int = 10) -> Dict[str, int]:
+def _histogram(scores, bucket_size: int = 10) -> Dict[str, int]:
     """Create a histogram of scores with the given bucket size."""
-    if not scores:
+    scores = np.asarray(scores)
+    if scores.size == 0:
         return {}
-    buckets: Dict[str, int] = {}
-    for score in scores:
-        bucket = (score // bucket_size) * bucket_size
-        key = f"{bucket}-{bucket + bucket_size - 1}"
-        buckets[key] = buckets.get(key, 0) + 1
-    return dict(sorted(buckets.items(), key=lambda x: int(x[0].split("-")[0])))
+    buckets, counts = np.unique(scores // bucket_size * bucket_size, return_counts=True)
+    return {
+        f"{bucket}-{bucket + bucket_size - 1}": count
+        for bucket, count in zip(buckets.tolist(), counts.tolist())
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -14,9 +14,11 @@ Depends on: models, config
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
-from src.config import ARCHETYPE_DEFAULTS, RP_TRAVERSAL_THRESHOLD, TOWER_L1_TELEOP_POINTS, TOWER_L2_POINTS, TOWER_L3_POINTS
+from src.archetypes import ARCHETYPE_DEFAULTS, ArchetypeName, ArchetypeSpec, get_archetype
+from src.config import RP_TRAVERSAL_THRESHOLD, TOWER_L1_TELEOP_POINTS, TOWER_L2_POINTS, TOWER_L3_POINTS
 from src.models import (
     ActiveShiftRole,
     AllianceConfig,
@@ -36,6 +38,7 @@ from src.models import (
     ShooterType,
     StrategyPreset,
     SwerveModule,
+    parse_enum,
 )
 
 
@@ -43,12 +46,12 @@ from src.models import (
 # Auto strategy presets
 # ---------------------------------------------------------------------------
 
-AUTO_PRESETS: Dict[str, List[AutoAction]] = {
-    "all_score": [AutoAction.SCORE_FUEL] * 3,
-    "2_score_1_climb": [AutoAction.SCORE_FUEL, AutoAction.SCORE_FUEL, AutoAction.CLIMB_L1],
-    "2_score_1_disrupt": [AutoAction.SCORE_FUEL, AutoAction.SCORE_FUEL, AutoAction.DISRUPT_NEUTRAL],
-    "1_score_1_climb_1_disrupt": [AutoAction.SCORE_FUEL, AutoAction.CLIMB_L1, AutoAction.DISRUPT_NEUTRAL],
-}
+AUTO_PRESETS: Mapping[str, Tuple[AutoAction, ...]] = MappingProxyType({
+    "all_score": (AutoAction.SCORE_FUEL,) * 3,
+    "2_score_1_climb": (AutoAction.SCORE_FUEL, AutoAction.SCORE_FUEL, AutoAction.CLIMB_L1),
+    "2_score_1_disrupt": (AutoAction.SCORE_FUEL, AutoAction.SCORE_FUEL, AutoAction.DISRUPT_NEUTRAL),
+    "1_score_1_climb_1_disrupt": (AutoAction.SCORE_FUEL, AutoAction.CLIMB_L1, AutoAction.DISRUPT_NEUTRAL),
+})
 
 
 # ---------------------------------------------------------------------------
@@ -68,20 +71,22 @@ _CONFIG_KEY_TO_ENUM: Dict[str, Archetype] = {
     "defense_bot": Archetype.DEFENSE,
 }
 
-_ENUM_TO_CONFIG_KEY: Dict[Archetype, str] = {v: k for k, v in _CONFIG_KEY_TO_ENUM.items()}
+_ENUM_TO_ARCHETYPE_ID: Dict[Archetype, ArchetypeName] = {
+    v: ArchetypeName[k.upper()] for k, v in _CONFIG_KEY_TO_ENUM.items()
+}
 
 
 # ---------------------------------------------------------------------------
 # Scoring-potential heuristic used for sorting robots within an alliance
 # ---------------------------------------------------------------------------
 
-def _get_archetype_defaults(archetype: Archetype) -> Dict[str, Any]:
+def _get_archetype_defaults(archetype: Archetype) -> Optional[ArchetypeSpec]:
     """Look up ARCHETYPE_DEFAULTS for a given Archetype enum member."""
-    config_key = _ENUM_TO_CONFIG_KEY.get(archetype)
-    if config_key and config_key in ARCHETYPE_DEFAULTS:
-        return ARCHETYPE_DEFAULTS[config_key]
+    archetype_id = _ENUM_TO_ARCHETYPE_ID.get(archetype)
+    if archetype_id is not None:
+        return get_archetype(archetype_id)
     # Fallback: try the enum value directly (works for most archetypes)
-    return ARCHETYPE_DEFAULTS.get(archetype.value, {})
+    return ARCHETYPE_DEFAULTS.get(archetype.value)
 
 
 def _scoring_potential(cfg: RobotConfig) -> float:
@@ -92,8 +97,8 @@ def _scoring_potential(cfg: RobotConfig) -> float:
     the *worst* to defense.
     """
     defaults = _get_archetype_defaults(cfg.archetype)
-    accuracy: float = defaults.get("accuracy", 0.0)
-    cycle_mean: float = defaults.get("cycle_time_mean", 99.0)
+    accuracy: float = defaults.accuracy if defaults else 0.0
+    cycle_mean: float = defaults.cycle_time_mean if defaults else 99.0
 
     # Avoid division by zero for defense bots (cycle_time_mean == 0)
     if cycle_mean <= 0:
@@ -110,9 +115,11 @@ def _climb_capability(cfg: RobotConfig) -> float:
     Weights higher levels more heavily, scaled by success probability.
     """
     defaults = _get_archetype_defaults(cfg.archetype)
-    l1 = defaults.get("climb_success_L1", 0.0)
-    l2 = defaults.get("climb_success_L2", 0.0)
-    l3 = defaults.get("climb_success_L3", 0.0)
+    if defaults is None:
+        return 0.0
+    l1 = defaults.climb_success_L1
+    l2 = defaults.climb_success_L2
+    l3 = defaults.climb_success_L3
 
     # Weighted sum: L3 is most valuable, L1 least
     return l3 * TOWER_L3_POINTS + l2 * TOWER_L2_POINTS + l1 * TOWER_L1_TELEOP_POINTS
@@ -180,7 +187,7 @@ def create_robot_config(archetype_name: str) -> RobotConfig:
             f"Valid archetypes: {sorted(ARCHETYPE_DEFAULTS.keys())}"
         )
 
-    d: Dict[str, Any] = ARCHETYPE_DEFAULTS[archetype_name]
+    d: ArchetypeSpec = get_archetype(archetype_name)
 
     # Map the config key to the Archetype enum member.
     archetype_enum = _CONFIG_KEY_TO_ENUM.get(archetype_name)
@@ -191,13 +198,13 @@ def create_robot_config(archetype_name: str) -> RobotConfig:
 
     # Map string values to their respective enums, handling the special
     # case where defense_bot has shooter_angle = "none" (not in the enum).
-    shooter_angle_str = d.get("shooter_angle", "fixed_high")
+    shooter_angle_str = d.shooter_angle
     if shooter_angle_str == "none":
         shooter_angle_val = ShooterAngle.FIXED_LOW  # placeholder for robots with no shooter
     else:
-        shooter_angle_val = ShooterAngle(shooter_angle_str)
+        shooter_angle_val = parse_enum(ShooterAngle, shooter_angle_str)
 
-    drivetrain_type = DrivetrainType(d["drivetrain"])
+    drivetrain_type = parse_enum(DrivetrainType, d.drivetrain)
 
     # Swerve module: assign a reasonable default based on drivetrain
     if drivetrain_type == DrivetrainType.SWERVE:
@@ -206,7 +213,7 @@ def create_robot_config(archetype_name: str) -> RobotConfig:
         swerve_module = SwerveModule.NONE
 
     # Gear ratio: infer from free speed
-    free_speed = d.get("free_speed_fps", 14.0)
+    free_speed = d.free_speed_fps
     if free_speed >= 17.0:
         gear_ratio = GearRatio.L3
     elif free_speed >= 14.0:
@@ -215,10 +222,10 @@ def create_robot_config(archetype_name: str) -> RobotConfig:
         gear_ratio = GearRatio.L1
 
     # Map indexer_type string to enum
-    indexer_str = d.get("indexer_type", "conveyor")
-    indexer_val = IndexerType(indexer_str)
+    indexer_str = d.indexer_type
+    indexer_val = parse_enum(IndexerType, indexer_str)
 
-    storage_cap = d.get("storage_capacity", d["fuel_capacity"])
+    storage_cap = d.storage_capacity
 
     return RobotConfig(
         archetype=archetype_enum,
@@ -229,27 +236,27 @@ def create_robot_config(archetype_name: str) -> RobotConfig:
         free_speed_fps=free_speed,
         can_fit_trench=True,
         # Shooter
-        shooter_type=ShooterType(d["shooter_type"]),
+        shooter_type=parse_enum(ShooterType, d.shooter_type),
         shooter_angle=shooter_angle_val,
-        hopper_type=HopperType(d["hopper_type"]),
+        hopper_type=parse_enum(HopperType, d.hopper_type),
         indexer_type=indexer_val,
         fuel_capacity=storage_cap,
         storage_capacity=storage_cap,
-        effective_range=d["effective_range"],
-        can_shoot_while_moving=d["can_shoot_while_moving"],
-        intake_rate=d.get("intake_rate", 4.0),
-        shoot_rate=d.get("shoot_rate", 6.0),
+        effective_range=d.effective_range,
+        can_shoot_while_moving=d.can_shoot_while_moving,
+        intake_rate=d.intake_rate,
+        shoot_rate=d.shoot_rate,
         # Intake
-        intake_type=IntakeType(d["intake_type"]),
-        intake_quality=IntakeQuality(d["intake_quality"]),
-        intake_robustness=IntakeRobustness(d["intake_robustness"]),
+        intake_type=parse_enum(IntakeType, d.intake_type),
+        intake_quality=parse_enum(IntakeQuality, d.intake_quality),
+        intake_robustness=parse_enum(IntakeRobustness, d.intake_robustness),
         # Strategy defaults (overridden by apply_strategy_preset)
-        auto_fuel_target=d["auto_fuel"],
+        auto_fuel_target=d.auto_fuel,
         auto_action=AutoAction.SCORE_FUEL,
-        auto_cycles=d.get("auto_cycles", 1),
-        auto_climb=d.get("auto_climb", False),
-        climb_target=d["climb_level"],
-        climb_start_time=d.get("climb_start_time", 10.0),
+        auto_cycles=d.auto_cycles,
+        auto_climb=d.auto_climb,
+        climb_target=d.climb_level,
+        climb_start_time=d.climb_start_time,
         active_shift_role=ActiveShiftRole.SCORE,
         inactive_shift_role=InactiveShiftRole.STOCKPILE,
         defense_target=None,
@@ -294,7 +301,7 @@ def create_alliance_config(
 
     # Validate preset early
     try:
-        preset_enum = StrategyPreset(strategy_preset)
+        preset_enum = parse_enum(StrategyPreset, strategy_preset)
     except ValueError:
         valid = [p.value for p in StrategyPreset]
         raise ValueError(
@@ -307,7 +314,7 @@ def create_alliance_config(
     if auto_plan is not None:
         if len(auto_plan) != 3:
             raise ValueError(f"auto_plan must have exactly 3 entries, got {len(auto_plan)}")
-        auto_actions = [AutoAction(a) for a in auto_plan]
+        auto_actions = [parse_enum(AutoAction, a) for a in auto_plan]
         # Validate: at most 1 robot does CLIMB_L1
         climb_count = sum(1 for a in auto_actions if a == AutoAction.CLIMB_L1)
         if climb_count > 1:
@@ -322,8 +329,8 @@ def create_alliance_config(
         robots=robots,
         strategy_preset=preset_enum,
         human_player_mode=HumanPlayerMode.MIXED,
-        endgame_plan=[0, 0, 0],
-        auto_plan=auto_actions,
+        endgame_plan=(0, 0, 0),
+        auto_plan=tuple(auto_actions),
     )
 
     apply_strategy_preset(alliance, strategy_preset)
@@ -382,7 +389,7 @@ def apply_strategy_preset(alliance: AllianceConfig, preset: str) -> None:
             f"Unknown strategy preset '{preset}'. Valid presets: {valid}"
         )
 
-    alliance.strategy_preset = StrategyPreset(preset)
+    alliance.strategy_preset = parse_enum(StrategyPreset, preset)
 
 
 def assign_endgame_plan(alliance: AllianceConfig) -> None:
@@ -393,8 +400,8 @@ def assign_endgame_plan(alliance: AllianceConfig) -> None:
     ``RP_TRAVERSAL_THRESHOLD`` (50 tower points) if the alliance has the
     mechanical ability to do so.
 
-    This mutates ``RobotConfig.climb_target`` and ``alliance.endgame_plan``
-    in place.
+    This mutates ``RobotConfig.climb_target`` in place and replaces
+    ``alliance.endgame_plan``.
 
     Parameters
     ----------
@@ -419,8 +426,7 @@ def assign_endgame_plan(alliance: AllianceConfig) -> None:
             target_level = 0
 
         # Only assign a level if the robot has a non-zero success rate for it
-        success_key = f"climb_success_L{target_level}"
-        success_rate = defaults.get(success_key, 0.0)
+        success_rate = defaults.climb_success[target_level]
 
         if success_rate > 0.0:
             plan[robot_idx] = target_level
@@ -429,8 +435,7 @@ def assign_endgame_plan(alliance: AllianceConfig) -> None:
             # Try lower levels until one works
             assigned = False
             for fallback in range(target_level - 1, 0, -1):
-                fb_key = f"climb_success_L{fallback}"
-                if defaults.get(fb_key, 0.0) > 0.0:
+                if defaults.climb_success[fallback] > 0.0:
                     plan[robot_idx] = fallback
                     robots[robot_idx].climb_target = fallback
                     assigned = True
@@ -447,15 +452,14 @@ def assign_endgame_plan(alliance: AllianceConfig) -> None:
             defaults = _get_archetype_defaults(robots[robot_idx].archetype)
             current = plan[robot_idx]
             for higher in range(current + 1, 4):
-                hk = f"climb_success_L{higher}"
-                if defaults.get(hk, 0.0) > 0.05:  # at least 5% chance
+                if defaults.climb_success[higher] > 0.05:  # at least 5% chance
                     plan[robot_idx] = higher
                     robots[robot_idx].climb_target = higher
                     break
             if _expected_tower_points(robots, plan) >= RP_TRAVERSAL_THRESHOLD:
                 break
 
-    alliance.endgame_plan = plan
+    alliance.endgame_plan = tuple(plan)
 
 
 def select_counter_strategy(
@@ -650,7 +654,6 @@ def _expected_tower_points(robots: List[RobotConfig], plan: List[int]) -> float:
         if level == 0:
             continue
         defaults = _get_archetype_defaults(robots[i].archetype)
-        success_key = f"climb_success_L{level}"
-        prob = defaults.get(success_key, 0.0)
+        prob = defaults.climb_success[level]
         total += prob * level_points[level]
     return total
@@ -0,0 +1,88 @@
+"""
+Unit tests for robot archetype defaults.
+
+Run with: pytest tests/test_archetypes.py
+"""
+
+import dataclasses
+
+import pytest
+from src.archetypes import (
+    ARCHETYPE_DEFAULTS,
+    ArchetypeName,
+    ArchetypeSpec,
+    get_archetype,
+)
+
+
+class TestArchetypeDefaults:
+    """Test suite for the frozen archetype table."""
+
+    def test_all_entries_are_specs(self):
+        """Every archetype is an ArchetypeSpec instance."""
+        assert len(ARCHETYPE_DEFAULTS) == 7
+        for spec in ARCHETYPE_DEFAULTS.values():
+            assert isinstance(spec, ArchetypeSpec)
+
+    def test_attribute_access(self):
+        """Spec fields are exposed as attributes."""
+        spec = ARCHETYPE_DEFAULTS["elite_turret"]
+        assert spec.accuracy == 0.90
+        assert spec.shooter_type == "single_turret"
+        assert spec.climb_success_L3 == 0.85
+
+    def test_climb_success_indexed_by_level(self):
+        """climb_success[level] mirrors the per-level fields."""
+        spec = ARCHETYPE_DEFAULTS["strong_scorer"]
+        assert spec.climb_success == (
+            0.0, spec.climb_success_L1, spec.climb_success_L2, spec.climb_success_L3
+        )
+
+    def test_climb_cdf_matches_two_stage_roll(self):
+        """CDF thresholds equal P(target) and P(target or fallback)."""
+        spec = ARCHETYPE_DEFAULTS["elite_multishot"]
+        p = spec.climb_success
+        assert spec.climb_cdf[1] == (p[1],)
+        assert spec.climb_cdf[3] == (p[3], p[3] + (1.0 - p[3]) * p[2])
+
+    def test_string_fields_are_interned(self):
+        """Categorical strings built at runtime share the interned object."""
+        base = ARCHETYPE_DEFAULTS["everybot"]
+        runtime_str = "".join(["single", "_fixed"])
+        spec = dataclasses.replace(base, shooter_type=runtime_str)
+        assert spec.shooter_type is base.shooter_type
+
+    def test_spec_is_frozen(self):
+        """Specs cannot be mutated after import."""
+        spec = ARCHETYPE_DEFAULTS["everybot"]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            spec.accuracy = 1.0
+
+    def test_spec_is_slotted(self):
+        """Specs carry no per-instance __dict__."""
+        assert not hasattr(ARCHETYPE_DEFAULTS["everybot"], "__dict__")
+
+    def test_mapping_is_read_only(self):
+        """The outer archetype mapping rejects assignment."""
+        with pytest.raises(TypeError):
+            ARCHETYPE_DEFAULTS["new_bot"] = ARCHETYPE_DEFAULTS["everybot"]
+
+
+class TestGetArchetype:
+    """Test suite for the archetype resolver."""
+
+    def test_ids_follow_table_order(self):
+        """ArchetypeName ids line up with ARCHETYPE_DEFAULTS keys."""
+        for name, key in zip(ArchetypeName, ARCHETYPE_DEFAULTS):
+            assert name.name.lower() == key
+
+    def test_resolves_by_string_and_id(self):
+        """String keys and ids return the same shared instance."""
+        spec = ARCHETYPE_DEFAULTS["defense_bot"]
+        assert get_archetype("defense_bot") is spec
+        assert get_archetype(ArchetypeName.DEFENSE_BOT) is spec
+
+    def test_unknown_name_raises(self):
+        """Unknown archetype keys raise KeyError."""
+        with pytest.raises(KeyError):
+            get_archetype("hover_bot")
@@ -0,0 +1,62 @@
+"""
+Unit tests for simulation configuration constants.
+
+Run with: pytest tests/test_config.py
+"""
+
+import sys
+
+from src import archetypes
+from src.config import (
+    AUTO_TICKS,
+    ENDGAME_TICKS,
+    INDEXER_JAM_RATES,
+    INDEXER_JAM_TABLE,
+    INDEXER_RATES,
+    INDEXER_RATE_TABLE,
+    SHIFT_TICKS,
+    TOTAL_MATCH_TICKS,
+    TRANSITION_TICKS,
+    Indexer,
+)
+from src.models import IndexerType
+
+
+class TestIndexerTables:
+    """Test suite for the enum-indexed indexer tables."""
+
+    def test_enum_covers_indexer_types(self):
+        """Every IndexerType resolves to an Indexer slot."""
+        for indexer_type in IndexerType:
+            assert Indexer[indexer_type.name].name.lower() == indexer_type.value
+
+    def test_string_views_match_tables(self):
+        """The string-keyed dicts agree with the tuples."""
+        for indexer in Indexer:
+            key = indexer.name.lower()
+            assert INDEXER_RATES[key] == INDEXER_RATE_TABLE[indexer]
+            assert INDEXER_JAM_RATES[key] == INDEXER_JAM_TABLE[indexer]
+
+
+class TestTickCounts:
+    """Test suite for integer tick constants."""
+
+    def test_phase_ticks_sum_to_match(self):
+        """Auto + transition + 4 shifts + endgame spans the whole match."""
+        assert AUTO_TICKS + TRANSITION_TICKS + 4 * SHIFT_TICKS + ENDGAME_TICKS == TOTAL_MATCH_TICKS
+        assert TOTAL_MATCH_TICKS == 320
+
+
+class TestLazyArchetypeExports:
+    """Test suite for config's lazy archetype re-exports."""
+
+    def test_reexports_archetype_table(self):
+        """src.config resolves archetype names from src.archetypes."""
+        config = sys.modules["src.config"]
+        assert config.ARCHETYPE_DEFAULTS is archetypes.ARCHETYPE_DEFAULTS
+        assert config.get_archetype is archetypes.get_archetype
+
+    def test_unknown_attribute_raises(self):
+        """Names outside the re-export set still raise AttributeError."""
+        config = sys.modules["src.config"]
+        assert not hasattr(config, "NOT_A_CONSTANT")
@@ -0,0 +1,146 @@
+"""
+Unit tests for the Field State Manager.
+
+Run with: pytest tests/test_field.py
+"""
+
+import pytest
+from src.config import (
+    FUEL_HUB_TRANSIT_TICKS,
+    FUEL_MISS_RECOVERY_TICKS,
+    INITIAL_OUTPOST_FUEL,
+    TICK_INTERVAL,
+)
+from src.field import FieldManager
+from src.models import Alliance, RobotState, RobotZone
+
+
+class TestTransitQueue:
+    """Test suite for the tick-indexed transit ring."""
+
+    def test_returns_fuel_after_delay(self):
+        """Scored and missed fuel come back on their own ticks."""
+        fm = FieldManager()
+        state = fm.get_state()
+        start = state.neutral_fuel_available
+        fm.tick(0.0, [])
+        fm.fuel_shot(6)
+        fm.fuel_scored("red", 4, current_time=0.0)
+        fm.fuel_missed(2, current_time=0.0)
+
+        returned = {}
+        for tick in range(1, FUEL_MISS_RECOVERY_TICKS + 1):
+            fm.tick(tick * TICK_INTERVAL, [])
+            returned[tick] = state.neutral_fuel_available - start
+
+        assert returned[FUEL_HUB_TRANSIT_TICKS - 1] == 0
+        assert returned[FUEL_HUB_TRANSIT_TICKS] == 4
+        assert returned[FUEL_MISS_RECOVERY_TICKS - 1] == 4
+        assert returned[FUEL_MISS_RECOVERY_TICKS] == 6
+        assert state.fuel_in_transit == 0
+        assert not any(state.transit_buckets)
+
+    def test_skipped_ticks_are_drained(self):
+        """Jumping past several ticks still releases every due slot."""
+        fm = FieldManager()
+        state = fm.get_state()
+        start = state.neutral_fuel_available
+        fm.fuel_shot(5)
+        fm.fuel_scored("red", 2, current_time=0.0)
+        fm.fuel_scored("blue", 3, current_time=0.0)
+
+        assert state.transit_buckets[FUEL_HUB_TRANSIT_TICKS] == 5
+        fm.tick(10.0, [])
+        assert state.neutral_fuel_available == start + 5
+        assert state.fuel_in_transit == 0
+
+    def test_scoring_ahead_of_the_cursor(self):
+        """Fuel scored at a time past the last tick still waits its full delay."""
+        fm = FieldManager()
+        state = fm.get_state()
+        start = state.neutral_fuel_available
+        now = 20
+        fm.fuel_shot(1)
+        fm.fuel_scored("red", 1, current_time=now * TICK_INTERVAL)
+
+        due = now + FUEL_HUB_TRANSIT_TICKS
+        for tick in range(1, due):
+            fm.tick(tick * TICK_INTERVAL, [])
+            assert state.neutral_fuel_available == start
+        fm.tick(due * TICK_INTERVAL, [])
+        assert state.neutral_fuel_available == start + 1
+
+
+class TestAllianceIndexing:
+    """Test suite for the [red, blue]-indexed outpost and tower state."""
+
+    def test_outpost_accepts_str_and_enum(self):
+        """String and Alliance/RobotZone keys hit the same outpost slot."""
+        fm = FieldManager()
+        state = fm.get_state()
+        assert fm.try_intake("red", "outpost", 3) == 3
+        assert fm.try_intake(Alliance.RED, RobotZone.OUTPOST, 3) == 3
+        assert fm.hp_feed(Alliance.BLUE)
+        assert state.red_outpost_fuel == INITIAL_OUTPOST_FUEL - 6
+        assert state.blue_outpost_fuel == INITIAL_OUTPOST_FUEL - 1
+
+    def test_tower_is_per_alliance(self):
+        """Registering on one tower leaves the other untouched."""
+        fm = FieldManager()
+        fm.register_climb("blue", "blue_1")
+        assert fm.get_state().tower_occupants == [[], ["blue_1"]]
+        assert fm.can_climb(Alliance.BLUE, "blue_1")
+
+    def test_unknown_alliance_rejected(self):
+        """A bad alliance raises ValueError naming it instead of a bare KeyError."""
+        fm = FieldManager()
+        with pytest.raises(ValueError, match="'green'"):
+            fm.hp_feed("green")
+        with pytest.raises(ValueError, match="'green'"):
+            fm.register_climb("green", "green_1")
+
+
+class TestPushFuel:
+    """Test suite for integer scatter arithmetic in push_fuel."""
+
+    def test_scatter_is_floor_of_twenty_percent(self):
+        """Arrived fuel is the pushed amount minus floor(20%)."""
+        fm = FieldManager()
+        state = fm.get_state()
+        before = state.neutral_fuel_available
+        assert fm.push_fuel("neutral", "alliance", 4) == 4
+        assert fm.push_fuel("neutral", "alliance", 10) == 8
+        assert fm.push_fuel("trench", "alliance", 10) == 0
+        assert state.neutral_fuel_available == before
+
+
+class TestCongestion:
+    """Test suite for hub congestion."""
+
+    def test_scales_with_robots_at_hub(self):
+        """One robot is free, two is half, three or more saturates."""
+        fm = FieldManager()
+        expected = (0.0, 0.0, 0.5, 1.0)
+        for n, congestion in enumerate(expected):
+            robots = [
+                RobotState(alliance=Alliance.RED, position=RobotZone.HUB)
+                for _ in range(n)
+            ]
+            robots.append(RobotState(alliance=Alliance.BLUE, position=RobotZone.HUB))
+            fm.tick(0.0, robots)
+            assert fm.get_state().congestion_red_hub == congestion
+            assert fm.get_state().congestion_blue_hub == 0.0
+
+
+class TestConservation:
+    """Test suite for the fuel conservation invariant."""
+
+    def test_counts_fuel_held_and_pushed(self):
+        """Fuel moved into robots is still counted toward the total."""
+        fm = FieldManager()
+        robots = [RobotState(), RobotState()]
+        before = fm.get_state().total_fuel_check(robots)
+        robots[0].fuel_held = fm.try_intake(Alliance.RED, RobotZone.NEUTRAL, 5)
+        robots[1].fuel_being_pushed = fm.try_intake(Alliance.BLUE, RobotZone.NEUTRAL, 3)
+        assert robots[0].fuel_held + robots[1].fuel_being_pushed == 8
+        assert fm.get_state().total_fuel_check(robots) == before
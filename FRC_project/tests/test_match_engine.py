@@ -0,0 +1,67 @@
+"""
+Unit tests for the Match Engine.
+
+Run with: pytest tests/test_match_engine.py
+"""
+
+from src.config import TICK_INTERVAL, TOTAL_MATCH_DURATION, TOTAL_MATCH_TICKS
+from src.match_engine import _PHASE_BY_TICK, MatchEngine, _get_phase
+from src.models import Phase
+from src.strategy import create_alliance_config
+
+
+class TestPhaseTable:
+    """Test suite for the precomputed per-tick phase table."""
+
+    def test_table_matches_boundary_scan(self):
+        """Every tick's entry equals the linear boundary lookup."""
+        assert len(_PHASE_BY_TICK) == TOTAL_MATCH_TICKS
+        for tick, phase in enumerate(_PHASE_BY_TICK):
+            assert phase is _get_phase(TOTAL_MATCH_DURATION - tick * TICK_INTERVAL)
+
+    def test_match_starts_in_auto_and_ends_in_endgame(self):
+        """First and last ticks fall in auto and endgame."""
+        assert _PHASE_BY_TICK[0] is Phase.AUTO
+        assert _PHASE_BY_TICK[-1] is Phase.ENDGAME
+
+
+class TestRunBatch:
+    """Test suite for multi-process batch execution."""
+
+    def test_batch_matches_individual_runs(self):
+        """Pooled results come back in spec order and equal serial runs."""
+        red = create_alliance_config(["elite_turret", "everybot", "kitbot_plus"], "full_offense")
+        blue = create_alliance_config(["everybot", "everybot", "defense_bot"], "full_offense")
+        specs = [(red, blue, seed) for seed in range(4)]
+        pooled = MatchEngine.run_batch(specs, workers=2)
+        assert pooled == [MatchEngine(r, b, seed=s).run() for r, b, s in specs]
+
+
+class TestScoreAccumulators:
+    """Test suite for the [red, blue] accumulators and MatchState sync."""
+
+    def test_match_state_synced_with_result(self):
+        """The shared MatchState ends the match agreeing with the result."""
+        red = create_alliance_config(["elite_turret", "strong_scorer", "everybot"], "full_offense")
+        blue = create_alliance_config(["everybot", "kitbot_plus", "defense_bot"], "2_score_1_defend")
+        engine = MatchEngine(red, blue, seed=3)
+        result = engine.run()
+        ms = engine.match_state
+        assert (ms.red_score, ms.blue_score) == (result.red_total_score, result.blue_total_score)
+        assert ms.red_fuel_scored == result.red_fuel_scored
+        assert ms.blue_tower_points == result.blue_tower_points
+        # MatchState records penalties by the side that committed them.
+        assert ms.red_penalties == result.blue_penalties_drawn
+
+
+class TestRobotColumns:
+    """Test suite for the per-robot columns built in __init__."""
+
+    def test_state_column_tracks_live_robot_state(self):
+        """The cached state list still aliases each robot's state after a match."""
+        red = create_alliance_config(["elite_turret", "everybot", "kitbot_plus"], "full_offense")
+        blue = create_alliance_config(["everybot", "everybot", "defense_bot"], "full_offense")
+        engine = MatchEngine(red, blue, seed=1)
+        engine.run()
+        for robot, state in zip(engine.all_robots, engine._robot_states):
+            assert state is robot.state
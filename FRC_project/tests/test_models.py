@@ -0,0 +1,24 @@
+"""
+Unit tests for shared model helpers.
+
+Run with: pytest tests/test_models.py
+"""
+
+import pytest
+
+from src.models import ShooterType, StrategyPreset, parse_enum
+
+
+class TestParseEnum:
+    """Test suite for the value-to-member enum lookup."""
+
+    def test_matches_enum_constructor(self):
+        """Every value parses to the same member as Enum(value)."""
+        for member in ShooterType:
+            assert parse_enum(ShooterType, member.value) is ShooterType(member.value)
+        assert parse_enum(ShooterType, ShooterType.DUMPER) is ShooterType.DUMPER
+
+    def test_unknown_value_raises(self):
+        """Unknown values still raise the constructor's ValueError."""
+        with pytest.raises(ValueError):
+            parse_enum(StrategyPreset, "not_a_preset")
@@ -0,0 +1,58 @@
+"""
+Unit tests for Monte Carlo statistics aggregation.
+
+Run with: pytest tests/test_stats.py
+"""
+
+import json
+
+from src.models import SimulationResult
+from src.stats import MonteCarloRunner, _histogram, compute_statistics
+from src.strategy import create_alliance_config
+
+
+def _result(red: int, blue: int, winner: str, energized: bool = False) -> SimulationResult:
+    return SimulationResult(
+        red_total_score=red, blue_total_score=blue, winner=winner,
+        red_energized=energized,
+    )
+
+
+class TestComputeStatistics:
+    """Test suite for the column-wise NumPy aggregation."""
+
+    def test_aggregates_match_hand_computed(self):
+        """Means, extremes, win and bonus rates match a small sample."""
+        stats = compute_statistics([
+            _result(100, 50, "red", energized=True),
+            _result(40, 60, "blue"),
+            _result(70, 70, "tie"),
+            _result(90, 30, "red"),
+        ])
+        assert stats["red_avg_score"] == 75.0
+        assert stats["red_score_min"] == 40
+        assert stats["blue_score_max"] == 70
+        assert stats["red_win_pct"] == 50.0
+        assert stats["tie_pct"] == 25.0
+        assert stats["red_energized_rate"] == 25.0
+
+    def test_output_is_json_serializable(self):
+        """NumPy scalars are converted back to plain Python numbers."""
+        stats = compute_statistics([_result(10, 20, "blue"), _result(30, 5, "red")])
+        json.dumps(stats)
+
+    def test_histogram_buckets_are_sorted(self):
+        """Scores fall into ascending fixed-width buckets."""
+        assert _histogram([105, 3, 9, 12]) == {"0-9": 2, "10-19": 1, "100-109": 1}
+
+
+class TestMonteCarloRunner:
+    """Test suite for serial and multi-process Monte Carlo runs."""
+
+    def test_workers_match_serial_run(self):
+        """Splitting seeds across a Pool gives the same statistics."""
+        red = create_alliance_config(["elite_turret", "everybot", "kitbot_plus"], "full_offense")
+        blue = create_alliance_config(["everybot", "everybot", "defense_bot"], "full_offense")
+        serial = MonteCarloRunner(red, blue, num_simulations=6, base_seed=7).run()
+        pooled = MonteCarloRunner(red, blue, num_simulations=6, base_seed=7, workers=2).run()
+        assert pooled == serial
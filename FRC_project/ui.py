@@ -18,7 +18,7 @@ from PIL import Image
 
 from src.tba_client import TBAClient, TBAError
 from src.tba_mapper import map_team_to_archetype, get_team_summary
-from src.config import ARCHETYPE_DEFAULTS
+from src.archetypes import ARCHETYPE_DEFAULTS
 from src.models import (
     AutoAction,
     StrategyPreset,
@@ -215,11 +215,11 @@ def _build_custom_robot(prefix, robot_num, base_archetype_key):
     d = ARCHETYPE_DEFAULTS[base]
     
     with st.sidebar.expander(f"R{robot_num} Subsystems"):
-        storage = st.slider("Storage Cap", 1, 30, d.get("storage_capacity", 10), help="Max fuel pieces. High capacity allows for long 'burst' scoring (scoring many points at once) but increases the time spent in the 'Intake' phase. Large stockpiles are vulnerable to being defended.", key=f"{prefix.lower()}_c{robot_num}_cap")
-        acc = st.slider("Accuracy (%)", 30, 100, int(d.get("accuracy", 0.5) * 100), help="Probability of a shot scoring in an active Hub. Higher accuracy directly correlates to higher score per cycle. Accuracy is penalized if an opponent is defending you.", key=f"{prefix.lower()}_c{robot_num}_acc")
-        rate = st.slider("Shoot Rate (f/s)", 1.0, 15.0, float(d.get("shoot_rate", 5.0)), help="Speed of launching fuel. Faster rates are critical for strategies like 'Surge' where you need to dump your entire storage in the limited Hub activation window.", key=f"{prefix.lower()}_c{robot_num}_rate")
-        climb = st.selectbox("Climb Target", [0, 1, 2, 3], index=d.get("climb_level", 0), help="Target level for endgame. Level 3 (30 pts) is the highest but hardest. Level 1 (10 pts) is reliable. Higher targets take longer to attempt and have lower success percentages.", key=f"{prefix.lower()}_c{robot_num}_climb")
-        climb_start = st.slider("Climb Start (s)", 0, 30, int(d.get("climb_start_time", 10)), help="Match time remaining when the robot stops scoring and moves to the Tower. Starting too late (e.g. 2s) might cause a 'Fail' if the climb duration exceeds time. Starting too early (e.g. 25s) guarantees points but loses valuable scoring time.", key=f"{prefix.lower()}_c{robot_num}_cstart")
+        storage = st.slider("Storage Cap", 1, 30, d.storage_capacity, help="Max fuel pieces. High capacity allows for long 'burst' scoring (scoring many points at once) but increases the time spent in the 'Intake' phase. Large stockpiles are vulnerable to being defended.", key=f"{prefix.lower()}_c{robot_num}_cap")
+        acc = st.slider("Accuracy (%)", 30, 100, int(d.accuracy * 100), help="Probability of a shot scoring in an active Hub. Higher accuracy directly correlates to higher score per cycle. Accuracy is penalized if an opponent is defending you.", key=f"{prefix.lower()}_c{robot_num}_acc")
+        rate = st.slider("Shoot Rate (f/s)", 1.0, 15.0, float(d.shoot_rate), help="Speed of launching fuel. Faster rates are critical for strategies like 'Surge' where you need to dump your entire storage in the limited Hub activation window.", key=f"{prefix.lower()}_c{robot_num}_rate")
+        climb = st.selectbox("Climb Target", [0, 1, 2, 3], index=d.climb_level, help="Target level for endgame. Level 3 (30 pts) is the highest but hardest. Level 1 (10 pts) is reliable. Higher targets take longer to attempt and have lower success percentages.", key=f"{prefix.lower()}_c{robot_num}_climb")
+        climb_start = st.slider("Climb Start (s)", 0, 30, int(d.climb_start_time), help="Match time remaining when the robot stops scoring and moves to the Tower. Starting too late (e.g. 2s) might cause a 'Fail' if the climb duration exceeds time. Starting too early (e.g. 25s) guarantees points but loses valuable scoring time.", key=f"{prefix.lower()}_c{robot_num}_cstart")
         
     return {"base": base, "storage_capacity": storage, "accuracy": acc/100.0, "shoot_rate": rate, "climb_target": climb, "climb_start_time": climb_start}
 
@@ -795,16 +795,16 @@ with tab_arch:
     
     c1, c2, c3 = st.columns(3)
     with c1:
-        st.write(f"**Shooter:** {d['shooter_type'].replace('_', ' ').title()}")
-        st.write(f"**Accuracy:** {d['accuracy']*100:.1f}%")
+        st.write(f"**Shooter:** {d.shooter_type.replace('_', ' ').title()}")
+        st.write(f"**Accuracy:** {d.accuracy*100:.1f}%")
     with c2:
-        st.write(f"**Storage:** {d['storage_capacity']} Fuel")
-        st.write(f"**Cycle Time:** {d['cycle_time_mean']}s")
+        st.write(f"**Storage:** {d.storage_capacity} Fuel")
+        st.write(f"**Cycle Time:** {d.cycle_time_mean}s")
     with c3:
         st.write(f"**Climb Success:**")
-        st.progress(d['climb_success_L1'], text=f"L1: {d['climb_success_L1']*100:.0f}%")
-        st.progress(d['climb_success_L2'], text=f"L2: {d['climb_success_L2']*100:.0f}%")
-        st.progress(d['climb_success_L3'], text=f"L3: {d['climb_success_L3']*100:.0f}%")
+        st.progress(d.climb_success_L1, text=f"L1: {d.climb_success_L1*100:.0f}%")
+        st.progress(d.climb_success_L2, text=f"L2: {d.climb_success_L2*100:.0f}%")
+        st.progress(d.climb_success_L3, text=f"L3: {d.climb_success_L3*100:.0f}%")
 
     st.divider()
     st.subheader("Full Season Comparison Table")
@@ -813,13 +813,13 @@ with tab_arch:
         ad = ARCHETYPE_DEFAULTS[a]
         comp_data.append({
             "Name": ARCHETYPE_LABELS[a],
-            "Type": ad['shooter_type'],
-            "Cap": ad['storage_capacity'],
-            "Cycle": ad['cycle_time_mean'],
-            "Acc": f"{ad['accuracy']*100:.0f}%",
-            "L1%": f"{ad['climb_success_L1']*100:.0f}%",
-            "L2%": f"{ad['climb_success_L2']*100:.0f}%",
-            "L3%": f"{ad['climb_success_L3']*100:.0f}%"
+            "Type": ad.shooter_type,
+            "Cap": ad.storage_capacity,
+            "Cycle": ad.cycle_time_mean,
+            "Acc": f"{ad.accuracy*100:.0f}%",
+            "L1%": f"{ad.climb_success_L1*100:.0f}%",
+            "L2%": f"{ad.climb_success_L2*100:.0f}%",
+            "L3%": f"{ad.climb_success_L3*100:.0f}%"
         })
     st.dataframe(pd.DataFrame(comp_data), use_container_width=True)
 